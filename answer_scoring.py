@@ -0,0 +1,395 @@
+# answer_scoring.py
+# Answer scoring front-end: a cache keyed on the normalized (question,
+# difficulty, answer) triple, a vectorized local TF-IDF scorer, and a mode
+# switch deciding when the LLM is consulted at all.
+import hashlib
+import re
+import time
+from collections import Counter, deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from cache import LRUCache, TieredCache
+from metrics import metrics
+from constants import (
+    SCORING_MODE,
+    SCORE_CACHE_SIZE,
+    SCORE_CACHE_TTL,
+    SCORE_CACHE_DB,
+    SCORE_LOCAL_MAX_WORDS,
+)
+
+SCORING_MODES = ("llm", "local", "hybrid")
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.#+-][a-z0-9]+)*")
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from how i if in into is it its of on or "
+    "so that the their then there these this to was we what when where which while who why "
+    "will with would you your".split()
+)
+EXPECTED_WORDS = {"easy": 25, "medium": 50, "hard": 80}
+POINT_MATCH_SIMILARITY = 0.2  # Cosine similarity at which a key point counts as covered
+MAX_LEARNED_REFERENCES = 5  # Strong LLM-graded answers kept per question as extra references
+MAX_LEARNED_QUESTIONS = 512  # Questions with learned references kept (least recently used evicted)
+
+# Key points a good answer covers, for the built-in question bank questions.
+REFERENCE_POINTS: Dict[str, List[str]] = {
+    "What is React state?": [
+        "state is data owned and managed inside a component",
+        "updating state with setState or useState setter triggers a re-render",
+        "state is mutable over time unlike props",
+    ],
+    "What is the difference between React state and props?": [
+        "props are passed from parent to child and are read only",
+        "state is owned by the component and can change",
+        "changing state or props triggers a re-render",
+    ],
+    "Explain the Node.js event loop in simple terms.": [
+        "node runs javascript on a single thread",
+        "asynchronous io callbacks are queued and run by the event loop",
+        "non blocking io lets node handle many connections",
+    ],
+    "What is the difference between let, const and var in JavaScript?": [
+        "var is function scoped and hoisted",
+        "let and const are block scoped",
+        "const cannot be reassigned but objects can still be mutated",
+    ],
+    "What does the HTTP status code 404 mean, and how does it differ from 500?": [
+        "404 not found means the requested resource does not exist client error",
+        "500 internal server error means the server failed",
+        "4xx codes are client errors and 5xx codes are server errors",
+    ],
+    "What is the purpose of package.json in a Node.js project?": [
+        "package.json lists project dependencies and versions",
+        "defines npm scripts such as start build and test",
+        "holds project metadata like name version and entry point",
+    ],
+    "What is the virtual DOM and why does React use it?": [
+        "virtual dom is an in memory representation of the real dom",
+        "react diffs the virtual dom to find changes reconciliation",
+        "only minimal changes are applied to the real dom for performance",
+    ],
+    "What is the difference between SQL and NoSQL databases?": [
+        "sql databases are relational with fixed schema tables and joins",
+        "nosql databases are schema flexible document key value or graph stores",
+        "sql offers acid transactions while nosql often scales horizontally",
+    ],
+    "Explain Node.js event loop.": [
+        "single threaded event loop processes callbacks from queues",
+        "phases timers pending callbacks poll check close callbacks",
+        "microtasks promises and process.nextTick run between phases",
+        "blocking the loop with cpu work stalls all requests",
+    ],
+    "How would you implement debounced search in React?": [
+        "debounce delays the search until the user stops typing",
+        "use settimeout in useEffect and clear it in the cleanup",
+        "cancel or ignore stale requests with abortcontroller",
+    ],
+    "Explain JWT authentication flow in Node.js/Express.": [
+        "server signs a jwt token after login with a secret",
+        "client sends the token in the authorization bearer header",
+        "middleware verifies the token signature and expiry",
+        "use refresh tokens and short expiry for security",
+    ],
+    "How does useEffect cleanup work, and when would you need it?": [
+        "the function returned from useEffect is the cleanup",
+        "cleanup runs before the effect re-runs and on unmount",
+        "needed for subscriptions timers event listeners and aborting requests",
+    ],
+    "What are Express middlewares and how is their order significant?": [
+        "middleware functions receive req res and next",
+        "middleware runs in the order it is registered with app.use",
+        "error handling middleware takes four arguments and goes last",
+    ],
+    "How would you prevent N+1 queries in a REST API backed by an ORM?": [
+        "n+1 happens when each row triggers another query",
+        "use eager loading joins or include to fetch relations together",
+        "batch queries with dataloader or where in clauses",
+    ],
+    "Explain CORS and how you would configure it for a React frontend and Node.js API.": [
+        "cors is a browser security policy for cross origin requests",
+        "server sends access-control-allow-origin headers",
+        "preflight options requests check allowed methods and headers",
+        "use the cors middleware with an allowed origin list",
+    ],
+    "How would you manage global state in a large React application?": [
+        "use context for simple shared state",
+        "use redux toolkit zustand or similar store for complex state",
+        "keep server state in react query and avoid unnecessary re-renders",
+    ],
+    "Design a scalable chat app.": [
+        "use websockets for real time bidirectional messaging",
+        "scale horizontally with pub sub such as redis or kafka between servers",
+        "persist messages in a database partitioned by conversation",
+        "handle presence delivery receipts and offline message sync",
+    ],
+    "Design a scalable file upload system with chunked uploads.": [
+        "split files into chunks uploaded in parallel with resume support",
+        "use presigned urls to upload directly to object storage like s3",
+        "track chunk progress and verify integrity with checksums",
+        "assemble chunks and process asynchronously with a queue",
+    ],
+    "Optimize a React app for large tables (10k+ rows).": [
+        "virtualize rows with react-window or react-virtualized",
+        "memoize rows and callbacks with react.memo usememo usecallback",
+        "paginate or load data lazily from the server",
+    ],
+    "Design a rate limiter for a public API running on multiple Node.js instances.": [
+        "token bucket or sliding window rate limiting algorithm",
+        "shared counters in redis so all instances see the same limits",
+        "return 429 with retry-after headers when limited",
+    ],
+    "How would you implement server-side rendering with data fetching and caching for a React app?": [
+        "render react on the server with next.js or rendertostring",
+        "fetch data on the server before rendering and hydrate on the client",
+        "cache rendered pages or data with a cdn and revalidation",
+    ],
+    "Design a notification service that delivers real-time and email notifications at scale.": [
+        "queue notifications with a message broker like kafka or rabbitmq",
+        "workers deliver via websocket push and email providers",
+        "handle retries idempotency and user preferences",
+    ],
+    "How would you migrate a monolithic Express app to services without downtime?": [
+        "use the strangler pattern to extract services incrementally",
+        "route traffic through an api gateway or proxy",
+        "migrate data carefully and use feature flags for gradual rollout",
+    ],
+    "Design the caching strategy for a read-heavy product catalogue API.": [
+        "cache responses in redis or memcached with ttl",
+        "use a cdn and http cache headers for public data",
+        "invalidate or update cache on writes and prevent stampedes",
+    ],
+}
+
+LLMScoreFn = Callable[[str, str, str, Optional[str]], Awaitable[Optional[dict]]]
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(TOKEN_RE.findall(text.lower()))
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def cache_key(question: str, difficulty: str, answer: str) -> str:
+    # Only whitespace is normalized: operators and punctuation matter in code answers
+    raw = "\x1f".join((" ".join(question.split()), difficulty.strip().lower(), " ".join(answer.split())))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class QuestionModel:
+    """TF-IDF matrix of one question's reference points, L2-normalized rows.
+
+    Rows are the reference point texts followed by the term counts of learned
+    answers; only the former are ever shown to candidates. IDF weights and the
+    reference-row similarities use the reference vocabulary only, so learned
+    answers never change how well an answer covers the key points.
+    """
+
+    def __init__(self, question: str, references: List[str], learned: Sequence[Counter] = ()):
+        self.has_references = bool(references)
+        self.references = references or [question]
+        reference_docs = [Counter(tokenize(r)) for r in self.references]
+        docs = reference_docs + list(learned)
+        self.vocab: Dict[str, int] = {}
+        for doc in reference_docs:
+            for token in doc:
+                self.vocab.setdefault(token, len(self.vocab))
+        self.reference_vocab = len(self.vocab)
+        for doc in learned:
+            for token in doc:
+                self.vocab.setdefault(token, len(self.vocab))
+        counts = np.zeros((len(docs), max(len(self.vocab), 1)))
+        for row, doc in enumerate(docs):
+            for token, n in doc.items():
+                counts[row, self.vocab[token]] = n
+        df = np.count_nonzero(counts[:len(self.references)], axis=0)
+        self.idf = np.log((1 + len(self.references)) / (1 + df)) + 1
+        matrix = counts * self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1, norms)
+
+    @staticmethod
+    def _cosine(rows: np.ndarray, vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return rows @ (vector / norm) if norm else np.zeros(rows.shape[0])
+
+    def similarities(self, answer_tokens: List[str]) -> np.ndarray:
+        ids = [self.vocab[t] for t in answer_tokens if t in self.vocab]
+        vector = np.bincount(ids, minlength=self.matrix.shape[1]) * self.idf
+        n, v = len(self.references), self.reference_vocab
+        return np.concatenate([
+            self._cosine(self.matrix[:n, :v], vector[:v]),
+            self._cosine(self.matrix[n:], vector),
+        ])
+
+
+class LocalScorer:
+    """Scores answers by key-point coverage and length, without the LLM."""
+
+    def __init__(self, references: Optional[Dict[str, List[str]]] = None):
+        self.references = {normalize_text(q): list(points) for q, points in (references or REFERENCE_POINTS).items()}
+        # Learned answers are kept as term counts only, never as text.
+        self.learned = LRUCache(maxsize=MAX_LEARNED_QUESTIONS)
+        self._models = LRUCache(maxsize=512)
+
+    def _model(self, question: str) -> QuestionModel:
+        key = normalize_text(question)
+        model = self._models.get(key)
+        if model is None:
+            model = QuestionModel(question, self.references.get(key, []), self.learned.get(key, ()))
+            self._models.set(key, model)
+        return model
+
+    def learn(self, question: str, answer: str):
+        """Keep the term counts of a strongly graded answer as an extra reference for its question"""
+        key = normalize_text(question)
+        if key not in self.references:
+            return  # Questions without key points are scored by length only
+        learned = self.learned.get(key)
+        if learned is None:
+            learned = deque(maxlen=MAX_LEARNED_REFERENCES)
+            self.learned.set(key, learned)
+        learned.append(Counter(tokenize(answer)))
+        self._models.discard(key)
+
+    def score_trivial(self, answer: str) -> dict:
+        """Word-count score for trivial answers and for questions without key points"""
+        word_count = len(answer.split())
+        feedback = f"Basic feedback: Your answer has {word_count} words. Elaborate more on technical concepts."
+        return {"score": min(word_count // 5, 7), "feedback": feedback}
+
+    def score(self, question: str, difficulty: str, answer: str) -> dict:
+        model = self._model(question)
+        if not model.has_references:
+            # Without key points (LLM-generated or refilled questions) only the length is meaningful
+            return self.score_trivial(answer)
+
+        word_count = len(answer.split())
+        sims = model.similarities(tokenize(answer))
+        # Coverage counts reference points only; learned answers just raise relevance.
+        covered = sims[:len(model.references)] >= POINT_MATCH_SIMILARITY
+        coverage = float(covered.mean())
+        relevance = float(sims.max())
+        length = min(word_count / EXPECTED_WORDS.get(difficulty, 50), 1.0)
+        score = int(round(10 * (0.6 * coverage + 0.2 * relevance + 0.2 * length)))
+        missing = [point for point, hit in zip(model.references, covered) if not hit][:2]
+        if missing:
+            feedback = f"Your answer has {word_count} words. Consider covering: " + "; ".join(missing) + "."
+        else:
+            feedback = f"Your answer has {word_count} words and covers the key points."
+        return {"score": max(0, min(score, 10)), "feedback": feedback}
+
+
+class ModeStats:
+    """Latency, source and LLM/local agreement counters for one scoring mode."""
+
+    def __init__(self, window: int = 1000):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.sources: Dict[str, int] = {}
+        self.compared = 0
+        self.agreed = 0
+        self.abs_diff = 0
+
+    def record(self, source: str, seconds: float):
+        self.sources[source] = self.sources.get(source, 0) + 1
+        self.latencies.append(seconds)
+
+    def compare(self, llm_score: int, local_score: int):
+        self.compared += 1
+        self.agreed += abs(llm_score - local_score) <= 1
+        self.abs_diff += abs(llm_score - local_score)
+
+    def as_dict(self) -> dict:
+        latencies = np.array(self.latencies) * 1000
+        return {
+            "requests": sum(self.sources.values()),
+            "sources": dict(self.sources),
+            "latency_ms": {
+                "mean": round(float(latencies.mean()), 2),
+                "p50": round(float(np.percentile(latencies, 50)), 2),
+                "p95": round(float(np.percentile(latencies, 95)), 2),
+            } if len(latencies) else None,
+            "agreement": {
+                "compared": self.compared,
+                "within_1_point": round(self.agreed / self.compared, 3),
+                "mean_abs_diff": round(self.abs_diff / self.compared, 2),
+            } if self.compared else None,
+        }
+
+
+class AnswerScorer:
+    """Routes an answer to the cache, the local scorer or the LLM.
+
+    Modes: "llm" uses the cache and the LLM; "local" only the local scorer;
+    "hybrid" additionally scores trivially short answers by word count.
+    `llm_fn(question, difficulty, answer, source)` returns a {"score",
+    "feedback"} dict, or None when the LLM could
+    not score the answer, in which case the local score is used and nothing
+    is cached.
+    """
+
+    def __init__(
+        self,
+        llm_fn: LLMScoreFn,
+        mode: str = SCORING_MODE,
+        local_max_words: int = SCORE_LOCAL_MAX_WORDS,
+        cache: Optional[TieredCache] = None,
+    ):
+        if mode not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode {mode!r}; expected one of {SCORING_MODES}")
+        self.llm_fn = llm_fn
+        self.mode = mode
+        self.local_max_words = local_max_words
+        self.local = LocalScorer()
+        self.cache = cache or TieredCache(
+            maxsize=SCORE_CACHE_SIZE, ttl=SCORE_CACHE_TTL, db_path=SCORE_CACHE_DB or None, table="scores"
+        )
+        self.mode_stats = {m: ModeStats() for m in SCORING_MODES}
+
+    async def score(
+        self, question: str, difficulty: str, answer: str, mode: Optional[str] = None, source: Optional[str] = None
+    ) -> dict:
+        mode = mode or self.mode
+        stats = self.mode_stats[mode]
+        start = time.perf_counter()
+
+        if mode == "local":
+            result = self.local.score(question, difficulty, answer)
+            stats.record("local", time.perf_counter() - start)
+            return result
+
+        key = cache_key(question, difficulty, answer)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            stats.record("cache", time.perf_counter() - start)
+            return cached
+
+        if mode == "hybrid" and len(answer.split()) <= self.local_max_words:
+            stats.record("trivial", time.perf_counter() - start)
+            return self.local.score_trivial(answer)
+
+        local = self.local.score(question, difficulty, answer)
+
+        # Resubmissions of an answer already being scored share one LLM call.
+        result = await self.cache.flight.do(key, lambda: self.llm_fn(question, difficulty, answer, source))
+        if result is None:
+            metrics.incr("fallback_score_local")
+            stats.record("local_fallback", time.perf_counter() - start)
+            return local
+
+        await self.cache.set(key, result)
+        stats.compare(result["score"], local["score"])
+        if result["score"] >= 8:
+            self.local.learn(question, answer)
+        stats.record("llm", time.perf_counter() - start)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "cache": self.cache.stats(),
+            "modes": {m: s.as_dict() for m, s in self.mode_stats.items() if s.sources},
+        }
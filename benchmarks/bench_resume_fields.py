@@ -0,0 +1,119 @@
+# bench_resume_fields.py
+# Compares the local resume field extractor with the full-LLM extraction path
+# over the sample corpus in benchmarks/data/sample_resumes.json.
+#
+# Usage (from the repository root):
+#   python benchmarks/bench_resume_fields.py [--threshold 0.8] [--repeat 200]
+#
+# The LLM path only runs when GROQ_API_KEY is configured; otherwise just the
+# local extractor is measured against the expected fields.
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import repo_env  # noqa: F401  (loads `cons` as `constants`)
+from constants import RESUME_FIELD_CONFIDENCE
+from groq_client import AsyncGroqClient, GroqError
+from resume_fields import extract_fields_local
+
+FIELDS = ("name", "email", "phone")
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sample_resumes.json")
+
+
+def normalize(field, value):
+    if not value:
+        return None
+    if field == "phone":
+        return "".join(c for c in value if c.isdigit())
+    return " ".join(str(value).lower().split())
+
+
+def same(field, a, b):
+    return normalize(field, a) == normalize(field, b)
+
+
+async def llm_extract(client: AsyncGroqClient, raw_text: str) -> dict:
+    # The prompt the service used before local-first extraction.
+    prompt = f"""
+    Extract the candidate's name, email, and phone from this resume text. Return as JSON with keys: name, email, phone.
+    Resume text:
+    {raw_text[:3000]}
+    Return only JSON.
+    """
+    try:
+        result = json.loads(await client.complete(prompt, max_tokens=300))
+    except (GroqError, ValueError):
+        return {}
+    return result if isinstance(result, dict) else {}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark local vs LLM resume field extraction")
+    parser.add_argument("--threshold", type=float, default=RESUME_FIELD_CONFIDENCE)
+    parser.add_argument("--repeat", type=int, default=200, help="local extractor timing iterations")
+    args = parser.parse_args()
+
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    local_correct = {field: 0 for field in FIELDS}
+    confident_correct = {field: 0 for field in FIELDS}
+    confident_total = {field: 0 for field in FIELDS}
+    docs_without_llm = 0
+    local_results = []
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for doc in corpus:
+            extract_fields_local(doc["text"])
+    local_us = (time.perf_counter() - start) / (args.repeat * len(corpus)) * 1e6
+
+    for doc in corpus:
+        result = extract_fields_local(doc["text"])
+        local_results.append(result)
+        if all(result[field].confidence >= args.threshold for field in FIELDS):
+            docs_without_llm += 1
+        for field in FIELDS:
+            correct = same(field, result[field].value, doc["expected"][field])
+            local_correct[field] += correct
+            if result[field].confidence >= args.threshold:
+                confident_total[field] += 1
+                confident_correct[field] += correct
+
+    n = len(corpus)
+    print(f"Corpus: {n} resumes, confidence threshold {args.threshold}")
+    print(f"Local extractor: {local_us:.1f} us/resume")
+    print(f"Resumes needing no LLM call: {docs_without_llm}/{n} ({docs_without_llm / n:.0%})")
+    print(f"{'field':<8}{'local acc':>12}{'confident':>12}{'conf. acc':>12}")
+    for field in FIELDS:
+        conf_acc = confident_correct[field] / confident_total[field] if confident_total[field] else 0.0
+        print(f"{field:<8}{local_correct[field] / n:>12.0%}{confident_total[field]:>12}{conf_acc:>12.0%}")
+
+    client = AsyncGroqClient()
+    if not client.configured:
+        print("\nGROQ_API_KEY not configured: skipping the LLM path comparison.")
+        return
+
+    llm_correct = {field: 0 for field in FIELDS}
+    agreement = {field: 0 for field in FIELDS}
+    latencies = []
+    for doc, local in zip(corpus, local_results):
+        start = time.perf_counter()
+        llm = await llm_extract(client, doc["text"])
+        latencies.append(time.perf_counter() - start)
+        for field in FIELDS:
+            llm_correct[field] += same(field, llm.get(field), doc["expected"][field])
+            agreement[field] += same(field, llm.get(field), local[field].value)
+    await client.aclose()
+
+    latencies.sort()
+    print(f"\nLLM path: {sum(latencies) / n * 1000:.0f} ms/resume mean, {latencies[n // 2] * 1000:.0f} ms p50")
+    print(f"{'field':<8}{'LLM acc':>12}{'agreement':>12}")
+    for field in FIELDS:
+        print(f"{field:<8}{llm_correct[field] / n:>12.0%}{agreement[field] / n:>12.0%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,193 @@
+# load_test.py
+# Closed-loop load generator for the API: N concurrent workers each send
+# requests back to back for a fixed count or duration, and client-side
+# latency percentiles, throughput and errors are reported per endpoint and
+# concurrency level. The server's own GET /metrics snapshot is printed at the
+# end so client latency can be matched against per-stage timings.
+#
+# Usage (from the repository root, API started with benchmarks/run_api.py):
+#   python benchmarks/load_test.py --concurrency 1 8 32 --requests 200
+#   python benchmarks/load_test.py --endpoints score-answer --duration 30 --unique
+# Pair with benchmarks/mock_groq_server.py to load-test without a GROQ key.
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import time
+from typing import Callable, Dict, List
+
+import httpx
+
+import repo_env  # noqa: F401  (loads `cons` as `constants`, which metrics needs)
+from metrics import percentile
+
+DEFAULT_RESUME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Swipe", "test_resume.docx")
+ENDPOINTS = ["parse-resume", "generate-questions", "score-answer", "finalize"]
+
+SAMPLE_QUESTIONS = [
+    ("easy", "What is the difference between let, const, and var in JavaScript?",
+     "let and const are block scoped, var is function scoped and hoisted. const cannot be reassigned."),
+    ("medium", "How would you implement authentication in a React application?",
+     "Store a JWT from the login endpoint in an httpOnly cookie, keep user state in a context and guard routes."),
+    ("hard", "How would you design a scalable chat application?",
+     "Use websockets behind a load balancer, a message broker for fan-out, and partition message storage by room."),
+]
+
+
+class RequestFactory:
+    """Builds the request for each endpoint; `unique` defeats server-side caches"""
+
+    def __init__(self, resume_path: str, unique: bool):
+        with open(resume_path, "rb") as f:
+            self.resume = f.read()
+        self.resume_name = os.path.basename(resume_path)
+        self.unique = unique
+
+    def _nonce(self) -> str:
+        return f"{random.getrandbits(48):012x}"
+
+    def _resume_bytes(self) -> bytes:
+        if not self.unique or not self.resume_name.endswith(".docx"):
+            return self.resume
+        # A distinct document per request, so every upload is a cache miss.
+        from docx import Document
+        document = Document(io.BytesIO(self.resume))
+        document.add_paragraph(f"Reference {self._nonce()}")
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return buffer.getvalue()
+
+    def build(self, endpoint: str) -> dict:
+        difficulty, question, answer = random.choice(SAMPLE_QUESTIONS)
+        if self.unique:
+            answer = f"{answer} ({self._nonce()})"
+        if endpoint == "parse-resume":
+            return {"url": "/parse-resume", "files": {"file": (self.resume_name, self._resume_bytes())}}
+        if endpoint == "generate-questions":
+            seed = random.randint(1, 10**6) if self.unique else 42
+            return {"url": "/generate-questions", "json": {"role": "fullstack", "seed": seed}}
+        if endpoint == "score-answer":
+            return {"url": "/score-answer", "json": {"question": question, "difficulty": difficulty, "answer": answer}}
+        return {
+            "url": "/finalize",
+            "json": {
+                "items": [
+                    {"question": q, "answer": a, "difficulty": d, "score": random.randint(4, 10)}
+                    for d, q, a in SAMPLE_QUESTIONS
+                ],
+                "profile": {"name": "Load Test", "email": "load.test@example.com", "phone": "+1 555 010 0000"},
+            },
+        }
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    build: Callable[[], dict],
+    concurrency: int,
+    requests: int,
+    duration: float,
+) -> dict:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    remaining = requests
+    stop_at = time.perf_counter() + duration if duration else None
+
+    def more() -> bool:
+        nonlocal remaining
+        if stop_at is not None:
+            return time.perf_counter() < stop_at
+        if remaining <= 0:
+            return False
+        remaining -= 1
+        return True
+
+    async def worker():
+        while more():
+            request = build()
+            start = time.perf_counter()
+            try:
+                response = await client.post(request.pop("url"), **request)
+                if response.status_code >= 400:
+                    key = f"HTTP {response.status_code}"
+                    errors[key] = errors.get(key, 0) + 1
+                    continue
+            except httpx.HTTPError as e:
+                key = type(e).__name__
+                errors[key] = errors.get(key, 0) + 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "concurrency": concurrency,
+        "ok": len(ordered),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 1),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+    }
+
+
+def print_row(endpoint: str, row: dict):
+    errors = sum(row["errors"].values())
+    print(
+        f"{endpoint:<20} c={row['concurrency']:<4} ok={row['ok']:<6} err={errors:<5} "
+        f"rps={row['throughput_rps']:<8} p50={row['p50_ms']:<8} p95={row['p95_ms']:<8} "
+        f"p99={row['p99_ms']:<8} max={row['max_ms']}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load-test the interview assistant API")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=100, help="requests per endpoint and concurrency level")
+    parser.add_argument("--duration", type=float, default=0, help="seconds per level (overrides --requests)")
+    parser.add_argument("--resume", default=DEFAULT_RESUME, help="file uploaded to /parse-resume")
+    parser.add_argument("--unique", action="store_true", help="vary payloads so caches miss")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--json", dest="json_path", help="also write results to this file")
+    args = parser.parse_args()
+
+    factory = RequestFactory(args.resume, args.unique)
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    results = []
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+        for endpoint in args.endpoints:
+            for concurrency in args.concurrency:
+                row = await run_level(client, lambda: factory.build(endpoint), concurrency, args.requests, args.duration)
+                print_row(endpoint, row)
+                results.append({"endpoint": endpoint, **row})
+
+        try:
+            server_metrics = (await client.get("/metrics")).json()
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Could not fetch /metrics: {e}")
+            server_metrics = None
+
+    if server_metrics:
+        print("\nServer stages (ms):")
+        for stage, stats in server_metrics["stages"].items():
+            print(f"  {stage:<45} n={stats['count']:<7} p50={stats['p50_ms']:<8} p95={stats['p95_ms']:<8} p99={stats['p99_ms']}")
+        if server_metrics["counters"]:
+            print("Server counters:")
+            for counter, value in server_metrics["counters"].items():
+                print(f"  {counter:<45} {value}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"results": results, "server_metrics": server_metrics}, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
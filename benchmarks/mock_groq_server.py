@@ -0,0 +1,113 @@
+# mock_groq_server.py
+# Local stand-in for the GROQ completions endpoint, for load tests and
+# profiling without a real provider. Latency, error rate and output size are
+# configurable; replies are shaped after the prompts the API sends so its
+# JSON parsing paths are exercised.
+#
+# Usage (from the repository root):
+#   python benchmarks/mock_groq_server.py --port 9000 --latency-ms 400 --error-rate 0.02
+# then start the API against it:
+#   GROQ_API_URL=http://localhost:9000/v1/completions GROQ_API_KEY=mock python benchmarks/run_api.py
+import argparse
+import asyncio
+import json
+import random
+import re
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+app = FastAPI(title="Mock GROQ API")
+config = argparse.Namespace(latency_ms=300.0, jitter_ms=100.0, error_rate=0.0, tokens=60, token_ms=5.0)
+stats = {"requests": 0, "errors": 0, "streams": 0}
+
+WORDS = (
+    "candidate demonstrates solid understanding of core concepts with clear examples "
+    "and should deepen knowledge of scalability testing and system design trade-offs"
+).split()
+
+
+def filler(n: int) -> str:
+    return " ".join(random.choice(WORDS) for _ in range(max(n, 1)))
+
+
+def reply_for(prompt: str) -> str:
+    """Plausible output for each prompt the API sends"""
+    if "Evaluate each of these" in prompt:
+        count = int(re.search(r"Evaluate each of these (\d+)", prompt).group(1))
+        return json.dumps([
+            {"index": i, "score": random.randint(3, 10), "feedback": filler(config.tokens // max(count, 1))}
+            for i in range(count)
+        ])
+    if "Evaluate this answer" in prompt:
+        return json.dumps({"score": random.randint(3, 10), "feedback": filler(config.tokens)})
+    if "Extract the candidate's" in prompt:
+        keys = re.search(r"Return as JSON with keys: ([\w, ]+)\.", prompt).group(1).split(", ")
+        values = {"name": "Mock Candidate", "email": "mock.candidate@example.com", "phone": "+1 555 010 0000"}
+        return json.dumps({k: values.get(k) for k in keys})
+    if "interview questions" in prompt:
+        match = re.search(r"Generate (\d+) distinct (\w+)", prompt)
+        if match:
+            n, difficulty = int(match.group(1)), match.group(2)
+            return json.dumps([
+                {"question": f"Mock {difficulty} question {random.getrandbits(32):08x}?", "timeLimit": 60}
+                for _ in range(n)
+            ])
+        return json.dumps([
+            {"id": i + 1, "difficulty": d, "question": f"Mock {d} question {i + 1}?", "timeLimit": t}
+            for i, (d, t) in enumerate([("easy", 20)] * 2 + [("medium", 60)] * 2 + [("hard", 120)] * 2)
+        ])
+    return filler(config.tokens)
+
+
+@app.post("/v1/completions")
+async def completions(request: Request):
+    stats["requests"] += 1
+    payload = await request.json()
+    await asyncio.sleep(max(random.gauss(config.latency_ms, config.jitter_ms), 0) / 1000)
+
+    if random.random() < config.error_rate:
+        stats["errors"] += 1
+        status = random.choice([429, 500, 503])
+        return JSONResponse(status_code=status, content={"error": "mock failure"}, headers={"Retry-After": "1"})
+
+    text = reply_for(payload.get("prompt", ""))
+    if not payload.get("stream"):
+        return {"output_text": text}
+
+    stats["streams"] += 1
+
+    async def events():
+        # Roughly one token per word, split so JSON structure spans chunks.
+        for piece in re.findall(r"\S+\s*", text):
+            await asyncio.sleep(config.token_ms / 1000)
+            yield f"data: {json.dumps({'output_text': piece})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/stats")
+async def get_stats():
+    return {**stats, "config": vars(config)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock GROQ completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=config.latency_ms, help="mean time to first byte")
+    parser.add_argument("--jitter-ms", type=float, default=config.jitter_ms, help="latency standard deviation")
+    parser.add_argument("--error-rate", type=float, default=config.error_rate, help="fraction of 429/5xx replies")
+    parser.add_argument("--tokens", type=int, default=config.tokens, help="words of free text per reply")
+    parser.add_argument("--token-ms", type=float, default=config.token_ms, help="delay between streamed tokens")
+    args = parser.parse_args()
+    for key in vars(config):
+        setattr(config, key, getattr(args, key))
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# repo_env.py
+# Makes the service modules importable from the benchmark scripts, the same
+# way tests/conftest.py does for the test suite: settings live in `cons`
+# (constants.py is only a placeholder), so they are loaded under the
+# `constants` name the modules import. Import this before any service module.
+import importlib.util
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _load(name: str, filename: str):
+    loader = SourceFileLoader(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+if not hasattr(sys.modules.get("constants"), "APP_HOST"):
+    _load("constants", "cons")
+
+
+def load_app():
+    """Load the API module from "assist(assistant py)" and return it"""
+    return _load("assist_main", "assist(assistant py)")
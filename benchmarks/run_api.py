@@ -0,0 +1,28 @@
+# run_api.py
+# Starts the API for load tests and profiling. The service lives in
+# "assist(assistant py)", which cannot be imported by name, and reads its
+# settings from `cons`; this loads both and serves the app with uvicorn.
+#
+# Usage (from the repository root):
+#   python benchmarks/run_api.py [--host 127.0.0.1] [--port 8000]
+# Against the mock provider (see benchmarks/mock_groq_server.py):
+#   GROQ_API_URL=http://localhost:9000/v1/completions GROQ_API_KEY=mock python benchmarks/run_api.py
+import argparse
+
+import repo_env
+from constants import APP_PORT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API from the repository checkout")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=APP_PORT)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(repo_env.load_app().app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# grading_jobs.py
+# Bulk interview grading jobs: interviews are graded by a bounded pool of
+# asyncio workers and every job, interview and result is persisted in SQLite,
+# so a restart resumes unfinished jobs instead of losing work.
+import asyncio
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from constants import GRADING_JOBS_DB, GRADING_WORKERS, GRADING_STREAM_POLL, GRADING_SAVE_RETRY_DELAY
+
+GradeFn = Callable[[dict], Awaitable[dict]]
+
+
+class JobStore:
+    """SQLite persistence for grading jobs. Methods are blocking."""
+
+    def __init__(self, path: str = GRADING_JOBS_DB):
+        self.path = path
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, total INTEGER NOT NULL, "
+                "completed INTEGER NOT NULL DEFAULT 0, failed INTEGER NOT NULL DEFAULT 0, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_items ("
+                "job_id TEXT NOT NULL, idx INTEGER NOT NULL, request TEXT NOT NULL, "
+                "result TEXT, completed_at REAL, PRIMARY KEY (job_id, idx))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def create_job(self, job_id: str, interviews: List[dict]):
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, total, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, "pending" if interviews else "completed", len(interviews), now, now),
+            )
+            conn.executemany(
+                "INSERT INTO job_items (job_id, idx, request) VALUES (?, ?, ?)",
+                [(job_id, i, json.dumps(interview)) for i, interview in enumerate(interviews)],
+            )
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, status, total, completed, failed, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "status", "total", "completed", "failed", "createdAt", "updatedAt")
+        return dict(zip(keys, row))
+
+    def unfinished_items(self) -> List[Tuple[str, int, dict]]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT i.job_id, i.idx, i.request FROM job_items i JOIN jobs j ON j.id = i.job_id "
+                "WHERE j.status IN ('pending', 'running') AND i.result IS NULL "
+                "ORDER BY j.created_at, i.idx"
+            ).fetchall()
+        return [(job_id, idx, json.loads(request)) for job_id, idx, request in rows]
+
+    def has_result(self, job_id: str, idx: int) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM job_items WHERE job_id = ? AND idx = ? AND result IS NOT NULL", (job_id, idx)
+            ).fetchone()
+        return row is not None
+
+    def save_result(self, job_id: str, idx: int, result: dict, failed: bool) -> bool:
+        """Record an item's result; False if it already had one (graded elsewhere or twice)"""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "UPDATE job_items SET result = ?, completed_at = ? WHERE job_id = ? AND idx = ? AND result IS NULL",
+                (json.dumps(result), now, job_id, idx),
+            )
+            if cursor.rowcount != 1:
+                return False
+            conn.execute(
+                "UPDATE jobs SET completed = completed + 1, failed = failed + ?, updated_at = ?, "
+                "status = CASE WHEN completed + 1 >= total THEN 'completed' ELSE 'running' END "
+                "WHERE id = ?",
+                (int(failed), now, job_id),
+            )
+        return True
+
+    def results(self, job_id: str, after: float = 0) -> List[Tuple[float, dict]]:
+        """Completed results with completed_at >= after, oldest first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT completed_at, result FROM job_items "
+                "WHERE job_id = ? AND result IS NOT NULL AND completed_at >= ? "
+                "ORDER BY completed_at, idx",
+                (job_id, after),
+            ).fetchall()
+        return [(completed_at, json.loads(result)) for completed_at, result in rows]
+
+
+class GradingJobManager:
+    """Grades queued interviews with `workers` concurrent asyncio workers.
+
+    `grade_fn(interview)` receives one FinalizeRequest-shaped dict and returns
+    the graded result as a dict. Queue entries carry the result once graded, so
+    a result whose save failed is re-queued for saving without grading again.
+    """
+
+    def __init__(self, grade_fn: GradeFn, db_path: str = GRADING_JOBS_DB, workers: int = GRADING_WORKERS):
+        self.grade_fn = grade_fn
+        self.store = JobStore(db_path)
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        for job_id, idx, interview in await asyncio.to_thread(self.store.unfinished_items):
+            self._queue.put_nowait((job_id, idx, interview, None))
+        if not self._queue.empty():
+            print(f"Resuming {self._queue.qsize()} unfinished grading job item(s)")
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, interviews: List[dict]) -> str:
+        job_id = uuid.uuid4().hex
+        await asyncio.to_thread(self.store.create_job, job_id, interviews)
+        for idx, interview in enumerate(interviews):
+            self._queue.put_nowait((job_id, idx, interview, None))
+        return job_id
+
+    async def _worker(self):
+        while True:
+            job_id, idx, interview, graded = await self._queue.get()
+            try:
+                if graded is None:
+                    # Another worker process may have finished it since it was queued
+                    try:
+                        if await asyncio.to_thread(self.store.has_result, job_id, idx):
+                            continue
+                    except sqlite3.Error:
+                        pass
+                    graded = await self._grade(job_id, idx, interview)
+                result, failed = graded
+                try:
+                    await asyncio.to_thread(self.store.save_result, job_id, idx, result, failed)
+                except sqlite3.Error as e:
+                    print(f"Grading job {job_id} item {idx} save error, retrying: {str(e)}")
+                    asyncio.get_running_loop().call_later(
+                        GRADING_SAVE_RETRY_DELAY, self._queue.put_nowait, (job_id, idx, interview, graded)
+                    )
+            finally:
+                self._queue.task_done()
+
+    async def _grade(self, job_id: str, idx: int, interview: dict) -> Tuple[dict, bool]:
+        try:
+            return {"index": idx, **await self.grade_fn(interview)}, False
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Grading job {job_id} item {idx} error: {str(e)}")
+            return {"index": idx, "error": str(e)}, True
+
+    async def get(self, job_id: str, include_results: bool = True) -> Optional[dict]:
+        job = await asyncio.to_thread(self.store.get_job, job_id)
+        if job is not None and include_results:
+            rows = await asyncio.to_thread(self.store.results, job_id)
+            job["results"] = sorted((result for _, result in rows), key=lambda r: r["index"])
+        return job
+
+    async def stream_results(self, job_id: str, follow: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Yield results as they complete; with follow, keep waiting until the job finishes"""
+        after = 0.0
+        seen = set()
+        while True:
+            job = await asyncio.to_thread(self.store.get_job, job_id)
+            for completed_at, result in await asyncio.to_thread(self.store.results, job_id, after):
+                if result["index"] in seen:
+                    continue
+                seen.add(result["index"])
+                after = completed_at
+                yield result
+            if not follow or job is None or job["status"] == "completed":
+                return
+            await asyncio.sleep(GRADING_STREAM_POLL)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    async def aclose(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
@@ -0,0 +1,293 @@
+# groq_client.py
+# Async GROQ client: one shared keep-alive connection pool, a cap on concurrent
+# in-flight calls, per-call deadlines, jittered retries and a circuit breaker.
+import asyncio
+import json
+import random
+import time
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from constants import (
+    GROQ_API_KEY,
+    GROQ_API_URL,
+    GROQ_MODEL,
+    GROQ_MAX_CONCURRENCY,
+    GROQ_TIMEOUT,
+    GROQ_MAX_RETRIES,
+    GROQ_CALL_DEADLINE,
+    GROQ_BACKOFF_BASE,
+    GROQ_BACKOFF_MAX,
+    GROQ_BREAKER_THRESHOLD,
+    GROQ_BREAKER_COOLDOWN,
+)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class GroqError(Exception):
+    """Raised when a GROQ completion could not be obtained."""
+
+
+class CircuitOpenError(GroqError):
+    """Raised without touching the network while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After `failure_threshold` transient failures in a row the circuit opens and
+    every call fails fast for `cooldown` seconds. Once the cooldown elapses a
+    single probe call is let through (half-open); its outcome closes or re-opens
+    the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probe_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def release(self):
+        """Forget a half-open probe that ended without a provider verdict."""
+        self._probe_in_flight = False
+
+
+class AsyncGroqClient:
+    """Pooled, non-blocking client for the GROQ completions endpoint."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = GROQ_API_KEY,
+        url: str = GROQ_API_URL,
+        model: str = GROQ_MODEL,
+        max_concurrency: int = GROQ_MAX_CONCURRENCY,
+        timeout: float = GROQ_TIMEOUT,
+        max_retries: int = GROQ_MAX_RETRIES,
+        deadline: float = GROQ_CALL_DEADLINE,
+        backoff_base: float = GROQ_BACKOFF_BASE,
+        backoff_max: float = GROQ_BACKOFF_MAX,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.api_key = api_key
+        self.url = url
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.deadline = deadline
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker(GROQ_BREAKER_THRESHOLD, GROQ_BREAKER_COOLDOWN)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key and self.api_key != "your-groq-api-key")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily so the pool and semaphore bind to the running event loop.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                timeout=self.timeout,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        # Full jitter: uniform in [0, base * 2^attempt], capped.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _post(self, payload: dict) -> dict:
+        client = self._get_client()
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    response = await client.post(self.url, json=payload)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+                retry_after = response.headers.get("Retry-After")
+                last_error = GroqError(f"GROQ returned HTTP {response.status_code}")
+            except httpx.HTTPStatusError as e:
+                # Non-retryable 4xx: the provider is up, the request is wrong.
+                raise GroqError(str(e)) from e
+            except (httpx.TransportError, ValueError) as e:
+                last_error = e
+            except httpx.HTTPError as e:
+                # Redirect loops, undecodable bodies and the like: retrying would not help.
+                raise GroqError(f"{type(e).__name__}: {e}") from e
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+        self.breaker.record_failure()
+        raise GroqError(str(last_error))
+
+    async def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.3,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Return the completion text for `prompt`.
+
+        `deadline` bounds the whole call, retries and backoff included; it
+        defaults to the client's `deadline` (GROQ_CALL_DEADLINE), so retries
+        stop once a caller would have given up anyway. Every failure is raised
+        as GroqError.
+        """
+        # Only the call that took the half-open probe slot may give it back.
+        probe = self.breaker.state == "half-open"
+        if not self.breaker.allow():
+            raise CircuitOpenError("GROQ circuit breaker is open")
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "max_output_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if deadline is None:
+            deadline = self.deadline
+        try:
+            data = await asyncio.wait_for(self._post(payload), timeout=deadline)
+            if not isinstance(data, dict):
+                self.breaker.record_failure()
+                raise GroqError(f"Unexpected GROQ response body: {type(data).__name__}")
+            self.breaker.record_success()
+            return data.get("output_text", "")
+        except asyncio.TimeoutError as e:
+            self.breaker.record_failure()
+            raise GroqError(f"GROQ call exceeded {deadline:.1f}s deadline") from e
+        except GroqError:
+            raise
+        except Exception as e:
+            raise GroqError(f"Unexpected GROQ client error: {type(e).__name__}: {e}") from e
+        finally:
+            # A half-open probe that ended without a verdict must not block later calls.
+            if probe:
+                if probe:
+                    self.breaker.release()
+
+    async def stream(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.3) -> AsyncIterator[str]:
+        """Yield completion text deltas as the provider produces them.
+
+        The provider is asked for server-sent events; each `data:` line holds a
+        JSON object whose `output_text` is the next delta, and `data: [DONE]`
+        ends the stream. Failures before the first delta are retried like
+        `complete`; the client timeout bounds each read rather than the call.
+        """
+        probe = self.breaker.state == "half-open"
+        if not self.breaker.allow():
+            raise CircuitOpenError("GROQ circuit breaker is open")
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "max_output_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        client = self._get_client()
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            started = False
+            try:
+                async with self._semaphore:
+                    async with client.stream("POST", self.url, json=payload) as response:
+                        if response.status_code in RETRYABLE_STATUS_CODES:
+                            retry_after = response.headers.get("Retry-After")
+                            last_error = GroqError(f"GROQ returned HTTP {response.status_code}")
+                        else:
+                            response.raise_for_status()
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[len("data:"):].strip()
+                                if data == "[DONE]":
+                                    break
+                                event = json.loads(data)
+                                text = event.get("output_text", "") if isinstance(event, dict) else ""
+                                if text:
+                                    started = True
+                                    yield text
+                            self.breaker.record_success()
+                            return
+            except httpx.HTTPStatusError as e:
+                if probe:
+                    self.breaker.release()
+                raise GroqError(str(e)) from e
+            except (httpx.TransportError, ValueError) as e:
+                if started:
+                    # Text already reached the caller; a retry would duplicate it.
+                    self.breaker.record_failure()
+                    raise GroqError(str(e)) from e
+                last_error = e
+            except httpx.HTTPError as e:
+                if probe:
+                    self.breaker.release()
+                raise GroqError(f"{type(e).__name__}: {e}") from e
+            except (asyncio.CancelledError, GeneratorExit):
+                if probe:
+                    self.breaker.release()
+                raise
+            except Exception as e:
+                if probe:
+                    self.breaker.release()
+                raise GroqError(f"Unexpected GROQ client error: {type(e).__name__}: {e}") from e
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+        self.breaker.record_failure()
+        raise GroqError(str(last_error))
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
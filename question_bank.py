@@ -0,0 +1,263 @@
+# question_bank.py
+# Pre-generated interview question pools per (role, difficulty). Question sets
+# are assembled deterministically from the request seed, so interview start
+# never waits on the LLM; pools that run low are topped up in the background.
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from cache import LRUCache
+from constants import (
+    QUESTION_BANK_PATH,
+    QUESTION_BANK_ROLES,
+    QUESTION_POOL_MIN_SIZE,
+    QUESTION_POOL_TARGET_SIZE,
+    QUESTION_REFILL_COOLDOWN,
+    QUESTION_SET_CACHE_SIZE,
+    QUESTION_SET_CACHE_TTL,
+)
+
+DIFFICULTY_ORDER = ["easy", "medium", "hard"]
+DEFAULT_TIME_LIMITS = {"easy": 20, "medium": 60, "hard": 120}
+
+# Shipped with the service so the default interview works with no LLM at all.
+SEED_POOLS: Dict[str, Dict[str, List[str]]] = {
+    "fullstack": {
+        "easy": [
+            "What is React state?",
+            "What is the difference between React state and props?",
+            "Explain the Node.js event loop in simple terms.",
+            "What is the difference between let, const and var in JavaScript?",
+            "What does the HTTP status code 404 mean, and how does it differ from 500?",
+            "What is the purpose of package.json in a Node.js project?",
+            "What is the virtual DOM and why does React use it?",
+            "What is the difference between SQL and NoSQL databases?",
+        ],
+        "medium": [
+            "Explain Node.js event loop.",
+            "How would you implement debounced search in React?",
+            "Explain JWT authentication flow in Node.js/Express.",
+            "How does useEffect cleanup work, and when would you need it?",
+            "What are Express middlewares and how is their order significant?",
+            "How would you prevent N+1 queries in a REST API backed by an ORM?",
+            "Explain CORS and how you would configure it for a React frontend and Node.js API.",
+            "How would you manage global state in a large React application?",
+        ],
+        "hard": [
+            "Design a scalable chat app.",
+            "Design a scalable file upload system with chunked uploads.",
+            "Optimize a React app for large tables (10k+ rows).",
+            "Design a rate limiter for a public API running on multiple Node.js instances.",
+            "How would you implement server-side rendering with data fetching and caching for a React app?",
+            "Design a notification service that delivers real-time and email notifications at scale.",
+            "How would you migrate a monolithic Express app to services without downtime?",
+            "Design the caching strategy for a read-heavy product catalogue API.",
+        ],
+    },
+}
+
+RefillFn = Callable[[str, str, int], Awaitable[List[dict]]]
+
+
+def _normalize(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+def _time_limit(value: Any, default: int) -> int:
+    """Seconds from an LLM-supplied time limit such as 60, "60" or "60s"; default if unusable"""
+    match = re.match(r"\s*(\d+)", str(value)) if value is not None else None
+    seconds = int(match.group(1)) if match else 0
+    return seconds if seconds > 0 else default
+
+
+class QuestionBank:
+    """Question pools with on-disk persistence and an LRU/TTL set cache.
+
+    `refill_fn(role, difficulty, n)` is awaited in the background to generate
+    up to `n` new questions (dicts with `question` and optional `timeLimit`)
+    whenever a pool drops below `min_pool_size`. Only the seeded roles and
+    `roles` are refilled, so arbitrary role strings from requests cannot
+    trigger LLM calls or grow the persisted bank.
+    """
+
+    def __init__(
+        self,
+        refill_fn: Optional[RefillFn] = None,
+        path: Optional[str] = QUESTION_BANK_PATH,
+        min_pool_size: int = QUESTION_POOL_MIN_SIZE,
+        target_pool_size: int = QUESTION_POOL_TARGET_SIZE,
+        refill_cooldown: float = QUESTION_REFILL_COOLDOWN,
+        cache_size: int = QUESTION_SET_CACHE_SIZE,
+        cache_ttl: Optional[float] = QUESTION_SET_CACHE_TTL,
+        roles: Iterable[str] = QUESTION_BANK_ROLES,
+    ):
+        self.refill_fn = refill_fn
+        self.path = path
+        self.min_pool_size = min_pool_size
+        self.target_pool_size = target_pool_size
+        self.refill_cooldown = refill_cooldown
+        self.roles = set(SEED_POOLS) | set(roles)
+        self.cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+        self.pools: Dict[str, Dict[str, List[dict]]] = {}
+        self._refill_tasks: Dict[tuple, asyncio.Task] = {}
+        self._last_refill: Dict[tuple, float] = {}
+        self.load()
+
+    # Persistence
+    def load(self):
+        """Load the persisted pools, dropping entries that do not fit role -> difficulty -> [question]"""
+        data = {}
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Question bank load error: {str(e)}")
+        if not isinstance(data, dict):
+            print(f"Question bank load error: expected an object of roles, got {type(data).__name__}")
+            data = {}
+        self.pools = {}
+        dropped = 0
+        for role, difficulties in data.items():
+            if not isinstance(difficulties, dict):
+                dropped += 1
+                continue
+            for difficulty, questions in difficulties.items():
+                if not isinstance(questions, list):
+                    dropped += 1
+                    continue
+                dropped += len(questions) - self.add(role, difficulty, questions)
+        if dropped:
+            print(f"Question bank load: dropped {dropped} malformed or duplicate entries")
+        for role, difficulties in SEED_POOLS.items():
+            for difficulty, questions in difficulties.items():
+                self.add(role, difficulty, [{"question": q} for q in questions])
+
+    def dumps(self) -> str:
+        return json.dumps(self.pools, indent=2)
+
+    def save(self, data: Optional[str] = None):
+        """Write the pools to disk; `data` is a snapshot from `dumps()` taken on the event loop"""
+        if not self.path:
+            return
+        if data is None:
+            data = self.dumps()
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Question bank save error: {str(e)}")
+
+    # Pool management
+    def pool(self, role: str, difficulty: str) -> List[dict]:
+        return self.pools.get(role, {}).get(difficulty, [])
+
+    def add(self, role: str, difficulty: str, questions: List[dict]) -> int:
+        """Append new, non-duplicate questions to a pool; returns how many were added.
+
+        Does not persist; callers save off the event loop once they are done.
+        """
+        pool = self.pools.setdefault(role, {}).setdefault(difficulty, [])
+        seen = {_normalize(q["question"]) for q in pool}
+        added = 0
+        for q in questions:
+            text = q.get("question") if isinstance(q, dict) else None
+            if not isinstance(text, str) or not text.strip() or _normalize(text) in seen:
+                continue
+            text = text.strip()
+            seen.add(_normalize(text))
+            pool.append({
+                "question": text,
+                "timeLimit": _time_limit(q.get("timeLimit"), DEFAULT_TIME_LIMITS.get(difficulty, 60)),
+            })
+            added += 1
+        return added
+
+    def _ordered_difficulties(self, counts: Dict[str, int]) -> List[str]:
+        known = [d for d in DIFFICULTY_ORDER if d in counts]
+        return known + sorted(d for d in counts if d not in DIFFICULTY_ORDER)
+
+    def assemble(self, role: str, counts: Dict[str, int], seed: int) -> Optional[List[dict]]:
+        """Return a deterministic question set, or None if the pools are too small."""
+        key = (role, tuple(sorted(counts.items())), seed)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        rng = random.Random(seed)
+        questions = []
+        missing = False
+        for difficulty in self._ordered_difficulties(counts):
+            n = max(counts[difficulty], 0)
+            pool = self.pool(role, difficulty)
+            if len(pool) < max(n, self.min_pool_size):
+                self.schedule_refill(role, difficulty)
+            if len(pool) < n:
+                missing = True
+                continue
+            for q in rng.sample(pool, n):
+                questions.append({"difficulty": difficulty, **q})
+        if missing:
+            return None
+
+        questions = [{"id": i + 1, **q} for i, q in enumerate(questions)]
+        self.cache.set(key, questions)
+        return questions
+
+    # Background refill
+    def schedule_refill(self, role: str, difficulty: str):
+        if self.refill_fn is None or role not in self.roles or difficulty not in DIFFICULTY_ORDER:
+            return
+        key = (role, difficulty)
+        task = self._refill_tasks.get(key)
+        if task is not None and not task.done():
+            return
+        if time.monotonic() - self._last_refill.get(key, float("-inf")) < self.refill_cooldown:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._last_refill[key] = time.monotonic()
+        self._refill_tasks[key] = loop.create_task(self._refill(role, difficulty))
+
+    def refill_low_pools(self):
+        for role, difficulties in self.pools.items():
+            for difficulty, pool in difficulties.items():
+                if len(pool) < self.target_pool_size:
+                    self.schedule_refill(role, difficulty)
+
+    async def _refill(self, role: str, difficulty: str):
+        needed = self.target_pool_size - len(self.pool(role, difficulty))
+        if needed <= 0:
+            return
+        try:
+            questions = await self.refill_fn(role, difficulty, needed)
+        except Exception as e:
+            print(f"Question bank refill error ({role}/{difficulty}): {str(e)}")
+            return
+        if self.add(role, difficulty, questions):
+            # Serialize here: the loop may mutate the pools while the thread writes.
+            await asyncio.to_thread(self.save, self.dumps())
+
+    async def aclose(self):
+        tasks = [t for t in self._refill_tasks.values() if not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "pools": {
+                role: {difficulty: len(pool) for difficulty, pool in difficulties.items()}
+                for role, difficulties in self.pools.items()
+            },
+            "refilling": sorted(f"{r}/{d}" for (r, d), t in self._refill_tasks.items() if not t.done()),
+            "set_cache": self.cache.stats(),
+        }
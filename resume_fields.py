@@ -0,0 +1,127 @@
+# resume_fields.py
+# Local, single-pass extraction of the candidate's name, email and phone from
+# resume text. Each field comes with a confidence so the caller only needs the
+# LLM for fields the local pass is unsure about.
+import re
+from typing import Dict, NamedTuple, Optional
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+PHONE_RE = re.compile(r"(?<![\w+(])[+(]?\d[\d\s().-]{8,18}\d(?!\w)")
+PHONE_LABEL_RE = re.compile(r"\b(phone|mobile|cell|tel|contact)\b", re.IGNORECASE)
+NAME_SPLIT_RE = re.compile(r"\s*(?:\||•|·|,|\s-\s|\s–\s)\s*")
+NAME_WORD_RE = re.compile(r"^[A-Z][A-Za-z'.-]*$")
+NON_DIGIT_RE = re.compile(r"\D")
+DIGIT_GROUP_RE = re.compile(r"\d+")
+YEAR_RE = re.compile(r"(?:19|20)\d\d")
+
+NAME_SKIP_WORDS = {
+    "resume", "cv", "curriculum", "vitae", "profile", "summary", "objective", "contact",
+    "engineer", "developer", "senior", "junior", "lead", "manager", "intern", "software",
+    "designer", "analyst", "consultant", "architect", "scientist", "experience", "education",
+    "skills", "technical", "projects", "certifications",
+}
+NAME_WINDOW_LINES = 5  # Only the top of the resume is searched for the name
+HEADER_LINES = 8  # Contact details found in the header are more trustworthy
+
+
+class FieldMatch(NamedTuple):
+    value: Optional[str]
+    confidence: float
+
+
+def _phone_digits(candidate: str) -> int:
+    return sum(c.isdigit() for c in candidate)
+
+
+def _is_year_run(candidate: str) -> bool:
+    """Date ranges such as "2014 - 2018 2018" look like phone numbers to PHONE_RE"""
+    groups = DIGIT_GROUP_RE.findall(candidate)
+    years = sum(1 for g in groups if YEAR_RE.fullmatch(g))
+    return years >= 2 and years >= len(groups) - 1
+
+
+def _name_candidate(line: str) -> Optional[str]:
+    for segment in NAME_SPLIT_RE.split(line):
+        words = segment.split()
+        if not 2 <= len(words) <= 4:
+            continue
+        if any(w.lower().strip(".") in NAME_SKIP_WORDS for w in words):
+            continue
+        if all(NAME_WORD_RE.match(w) for w in words):
+            return segment
+    return None
+
+
+def extract_fields_local(text: str) -> Dict[str, FieldMatch]:
+    """Extract name, email and phone in one pass over the resume lines"""
+    name = email = phone = None
+    name_line = 0
+    emails = set()
+    phones = set()
+    email_in_header = phone_in_header = phone_labelled = False
+    nonempty = 0
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        nonempty += 1
+        in_header = nonempty <= HEADER_LINES
+
+        if name is None and nonempty <= NAME_WINDOW_LINES:
+            name = _name_candidate(stripped)
+            name_line = nonempty
+
+        if "@" in stripped:
+            for match in EMAIL_RE.finditer(stripped):
+                found = match.group(0)
+                if email is None:
+                    email, email_in_header = found, in_header
+                emails.add(found.lower())
+
+        if sum(c.isdigit() for c in stripped) >= 10:
+            for match in PHONE_RE.finditer(stripped):
+                found = match.group(0).strip()
+                if not 10 <= _phone_digits(found) <= 15 or _is_year_run(found):
+                    continue
+                if phone is None:
+                    phone, phone_in_header = found, in_header
+                    phone_labelled = bool(PHONE_LABEL_RE.search(stripped))
+                phones.add(NON_DIGIT_RE.sub("", found))
+
+    if email is None:
+        email_conf = 0.0
+    else:
+        email_conf = 0.95 if email_in_header else 0.85
+        if len(emails) > 1:
+            email_conf -= 0.1
+
+    # Position alone never clears the LLM threshold (0.8): a digit run needs a
+    # label or phone formatting, a name needs the email to agree with it.
+    if phone is None:
+        phone_conf = 0.0
+    else:
+        phone_conf = 0.65 if phone_in_header else 0.55
+        if phone_labelled:
+            phone_conf += 0.25
+        if phone.startswith("+") or "(" in phone:
+            phone_conf += 0.2
+        if len(phones) > 1:
+            phone_conf -= 0.35
+
+    if name is None:
+        name_conf = 0.0
+    else:
+        name_conf = 0.7 if name_line == 1 else 0.6 if name_line <= 3 else 0.5
+        local_part = email.split("@")[0].lower() if email else ""
+        if local_part:
+            if any(w.lower() in local_part for w in name.split() if len(w) > 2):
+                name_conf += 0.25
+            else:
+                name_conf -= 0.2
+
+    return {
+        "name": FieldMatch(name, round(min(name_conf, 0.99), 2)),
+        "email": FieldMatch(email, round(min(email_conf, 0.99), 2)),
+        "phone": FieldMatch(phone, round(min(phone_conf, 0.99), 2)),
+    }
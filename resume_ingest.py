@@ -0,0 +1,173 @@
+# resume_ingest.py
+# Size-bounded resume upload reading and off-loop text extraction. PDFs are
+# split into page ranges that run in parallel in a process pool, and
+# extraction stops as soon as enough text has been collected.
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile
+
+from constants import (
+    MAX_FILE_SIZE,
+    MAX_TEXT_LENGTH,
+    UPLOAD_CHUNK_SIZE,
+    EXTRACTION_WORKERS,
+    PDF_PAGES_PER_TASK,
+)
+from metrics import metrics
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+
+async def read_upload(file: UploadFile, max_bytes: int = MAX_FILE_SIZE, hasher=None) -> bytearray:
+    """Read an upload in chunks, rejecting it with 413 as soon as it exceeds max_bytes.
+
+    If given, `hasher` (a hashlib object) is updated with each chunk as it is read.
+    The buffer is returned as is rather than copied into `bytes`, so peak memory
+    stays at one copy of the upload.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail=f"File exceeds {max_bytes // (1024 * 1024)}MB limit")
+
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        if len(buffer) > max_bytes:
+            raise HTTPException(status_code=413, detail=f"File exceeds {max_bytes // (1024 * 1024)}MB limit")
+    return buffer
+
+
+# Worker functions: module-level so they can be pickled into the process pool.
+# Each task receives the whole upload and re-opens the PDF, so a wave of N page
+# ranges pickles the file N times; PDF_PAGES_PER_TASK trades that against
+# parallelism.
+def extract_pdf_pages(data: bytes, start: int, stop: int, max_chars: int) -> Tuple[str, int]:
+    """Extract pages [start, stop) of a PDF; returns (text, total page count)"""
+    if pypdf is None:
+        return "PDF parsing library not available", 0
+    reader = pypdf.PdfReader(BytesIO(data))
+    total = len(reader.pages)
+    parts = []
+    size = 0
+    for i in range(start, min(stop, total)):
+        text = reader.pages[i].extract_text() or ""
+        parts.append(text)
+        size += len(text)
+        if size >= max_chars:
+            break
+    return "\n".join(parts), total
+
+
+def extract_docx_text(data: bytes, max_chars: int = MAX_TEXT_LENGTH) -> str:
+    if Document is None:
+        return "DOCX parsing library not available"
+    doc = Document(BytesIO(data))
+    parts = []
+    size = 0
+    for paragraph in doc.paragraphs:
+        parts.append(paragraph.text)
+        size += len(paragraph.text) + 1
+        if size >= max_chars:
+            break
+    return "\n".join(parts)
+
+
+class ResumeIngestor:
+    """Runs resume text extraction in a process pool, off the event loop."""
+
+    def __init__(
+        self,
+        workers: int = EXTRACTION_WORKERS,
+        pages_per_task: int = PDF_PAGES_PER_TASK,
+        max_chars: int = MAX_TEXT_LENGTH,
+    ):
+        self.workers = workers
+        self.pages_per_task = pages_per_task
+        self.max_chars = max_chars
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _reset_executor(self, broken: ProcessPoolExecutor):
+        # Concurrent failures of the same pool replace it only once.
+        if self._executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+
+    async def _extract_pdf(self, data: bytes) -> str:
+        # The first range also tells us the page count; one-page resumes stop here.
+        text, total = await self._run(extract_pdf_pages, data, 0, self.pages_per_task, self.max_chars)
+        parts: List[str] = [text]
+        collected = len(text)
+        start = self.pages_per_task
+        while collected < self.max_chars and start < total:
+            # Fan out one wave of page ranges, then stop early if it was enough.
+            wave = []
+            for _ in range(self.workers):
+                if start >= total:
+                    break
+                wave.append(self._run(extract_pdf_pages, data, start, start + self.pages_per_task, self.max_chars))
+                start += self.pages_per_task
+            for text, _ in await asyncio.gather(*wave):
+                parts.append(text)
+                collected += len(text)
+        return "\n".join(parts)[:self.max_chars]
+
+    async def _extract(self, data: bytes, ext: str) -> str:
+        if ext == "pdf":
+            return await self._extract_pdf(data)
+        return (await self._run(extract_docx_text, data, self.max_chars))[:self.max_chars]
+
+    async def extract_text(self, data: bytes, ext: str) -> str:
+        """Extract at most max_chars of text from a PDF or DOCX; returns "" if unreadable.
+
+        A pool worker that dies (out of memory, crash on a hostile file) breaks
+        the whole pool; it is then replaced and the extraction retried once.
+        If that fails too, 503 is raised rather than reporting the file as empty.
+        """
+        try:
+            with metrics.timer(f"extract_{ext}"):
+                executor = self._get_executor()
+                try:
+                    return await self._extract(data, ext)
+                except BrokenProcessPool:
+                    metrics.incr("extract_pool_restarts")
+                    self._reset_executor(executor)
+                executor = self._get_executor()
+                return await self._extract(data, ext)
+        except BrokenProcessPool as e:
+            print(f"Resume extraction error: {str(e)}")
+            metrics.incr("extract_errors")
+            self._reset_executor(executor)
+            raise HTTPException(status_code=503, detail="Resume extraction failed, please try again")
+        except Exception as e:
+            print(f"Resume extraction error: {str(e)}")
+            metrics.incr("extract_errors")
+            return ""
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
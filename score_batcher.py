@@ -0,0 +1,115 @@
+# score_batcher.py
+# Micro-batching for LLM calls: requests arriving within a short window are
+# sent as one multi-item prompt and the per-item results fanned back out.
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from constants import SCORE_BATCH_MAX_SIZE, SCORE_BATCH_WAIT_MS
+
+BatchFn = Callable[[List[Any]], Awaitable[Optional[List[Any]]]]
+SingleFn = Callable[[Any], Awaitable[Any]]
+
+
+class MicroBatcher:
+    """Collects submitted items for up to `max_wait_ms` or `max_batch_size` items.
+
+    `batch_fn(items)` must return one result per item, in order, or None when
+    the batched reply was malformed; the batch is then retried item by item
+    with `single_fn`. A batch of one goes straight to `single_fn`.
+
+    Items are only batched with items submitted under the same `group`, so
+    callers can keep different sources (e.g. candidates) out of one prompt.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        single_fn: SingleFn,
+        max_batch_size: int = SCORE_BATCH_MAX_SIZE,
+        max_wait_ms: float = SCORE_BATCH_WAIT_MS,
+    ):
+        self.batch_fn = batch_fn
+        self.single_fn = single_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.items = 0
+        self.batches = 0
+        self.calls = 0
+        self.malformed_batches = 0
+
+    async def submit(self, item: Any, group: Hashable = None) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(group, [])
+        pending.append((item, future))
+        if len(pending) >= self.max_batch_size:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(self.max_wait_ms / 1000, self._flush, group)
+        return await future
+
+    async def call(self, item: Any) -> Any:
+        """Send one item to `single_fn` now, without waiting for a batch.
+
+        Counted in stats() as a batch of one, so unbatched traffic still shows
+        up in `calls_per_item`.
+        """
+        self.items += 1
+        self.batches += 1
+        self.calls += 1
+        return await self.single_fn(item)
+
+    def _flush(self, group: Hashable):
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, [])
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        self.items += len(items)
+        self.batches += 1
+        try:
+            results = None
+            if len(items) > 1:
+                self.calls += 1
+                results = await self.batch_fn(items)
+                if results is None or len(results) != len(items):
+                    self.malformed_batches += 1
+                    results = None
+            if results is None:
+                self.calls += len(items)
+                results = await asyncio.gather(*(self.single_fn(item) for item in items))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def aclose(self):
+        for group in list(self._pending):
+            self._flush(group)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "items": self.items,
+            "batches": self.batches,
+            "llm_calls": self.calls,
+            "malformed_batches": self.malformed_batches,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "calls_per_item": round(self.calls / self.items, 3) if self.items else 0.0,
+        }
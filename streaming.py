@@ -0,0 +1,76 @@
+# streaming.py
+# Helpers for the streaming endpoints: Server-Sent Events / NDJSON framing and
+# an incremental parser that pulls complete elements out of a JSON array while
+# the LLM is still generating it.
+import json
+from typing import Any, List
+
+SSE_MEDIA_TYPE = "text/event-stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Keeps reverse proxies (nginx) from buffering the stream.
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_event(event: str, data: Any, fmt: str = "sse") -> str:
+    """Frame one event as SSE (`event:`/`data:` lines) or as an NDJSON line"""
+    if fmt == "ndjson":
+        return json.dumps({"type": event, "data": data}) + "\n"
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def media_type(fmt: str) -> str:
+    return NDJSON_MEDIA_TYPE if fmt == "ndjson" else SSE_MEDIA_TYPE
+
+
+class JsonArrayItemParser:
+    """Incrementally extracts the top-level objects of a streamed JSON array.
+
+    Text before the opening `[` (e.g. a preamble) is ignored. Each call to
+    `feed` returns the elements completed by that chunk; elements that are not
+    valid JSON objects are skipped.
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+
+    def feed(self, chunk: str) -> List[dict]:
+        items = []
+        for char in chunk:
+            if not self._started:
+                if char == "[":
+                    self._started = True
+                continue
+            if self._depth > 0:
+                self._buffer.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0:
+                    self._buffer = [char]
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # End of the top-level array.
+                    self._started = False
+                    continue
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        item = json.loads("".join(self._buffer))
+                    except ValueError:
+                        item = None
+                    if isinstance(item, dict):
+                        items.append(item)
+                    self._buffer = []
+        return items
@@ -0,0 +1,16 @@
+# conftest.py
+# Makes the service modules importable from the repository root. Settings
+# live in `cons` (constants.py is only a placeholder), so they are loaded
+# under the `constants` name the modules import.
+import importlib.util
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_loader = SourceFileLoader("constants", os.path.join(ROOT, "cons"))
+_constants = importlib.util.module_from_spec(importlib.util.spec_from_loader("constants", _loader))
+_loader.exec_module(_constants)
+sys.modules["constants"] = _constants
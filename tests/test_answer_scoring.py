@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from answer_scoring import MAX_LEARNED_REFERENCES, AnswerScorer, LocalScorer, cache_key, normalize_text
+from cache import TieredCache
+
+REFERENCED = "Explain Node.js event loop."
+UNREFERENCED = "Explain closures in JS"
+GOOD_ANSWER = (
+    "Node runs a single threaded event loop that processes callbacks from queues in phases: timers, "
+    "pending callbacks, poll, check and close callbacks. Microtasks such as promises and process.nextTick "
+    "run between phases, and blocking the loop with cpu work stalls all requests."
+)
+
+
+class FakeLLM:
+    def __init__(self, result=None):
+        self.result = result if result is not None else {"score": 9, "feedback": "Great"}
+        self.calls = []
+
+    async def __call__(self, question, difficulty, answer, source=None):
+        self.calls.append((question, difficulty, answer, source))
+        return self.result
+
+
+def make_scorer(llm, mode="llm", local_max_words=3):
+    return AnswerScorer(llm, mode=mode, local_max_words=local_max_words, cache=TieredCache(maxsize=64))
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        make_scorer(FakeLLM(), mode="magic")
+
+
+def test_llm_mode_uses_the_llm_and_caches_the_result():
+    llm = FakeLLM()
+    scorer = make_scorer(llm)
+
+    async def scenario():
+        first = await scorer.score(REFERENCED, "hard", GOOD_ANSWER)
+        second = await scorer.score(REFERENCED, "hard", "  " + GOOD_ANSWER.replace(" ", "  "))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second == {"score": 9, "feedback": "Great"}
+    assert len(llm.calls) == 1
+    assert scorer.mode_stats["llm"].sources == {"llm": 1, "cache": 1}
+
+
+def test_local_mode_never_calls_the_llm():
+    llm = FakeLLM()
+    result = asyncio.run(make_scorer(llm, mode="local").score(REFERENCED, "hard", GOOD_ANSWER))
+    assert 0 <= result["score"] <= 10
+    assert llm.calls == []
+
+
+def test_hybrid_mode_scores_only_trivial_answers_locally():
+    llm = FakeLLM()
+    scorer = make_scorer(llm, mode="hybrid", local_max_words=3)
+
+    async def scenario():
+        short = await scorer.score(REFERENCED, "hard", "it loops")
+        keywords = await scorer.score(REFERENCED, "hard", "single threaded callbacks queues phases microtasks cpu blocking")
+        return short, keywords
+
+    short, keywords = asyncio.run(scenario())
+    assert short["score"] == 0
+    assert keywords == {"score": 9, "feedback": "Great"}
+    assert len(llm.calls) == 1
+
+
+def test_llm_failure_falls_back_to_local_without_caching():
+    llm = FakeLLM()
+    llm.result = None
+    scorer = make_scorer(llm)
+
+    async def scenario():
+        first = await scorer.score(REFERENCED, "hard", GOOD_ANSWER)
+        llm.result = {"score": 8, "feedback": "Recovered"}
+        second = await scorer.score(REFERENCED, "hard", GOOD_ANSWER)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first != {"score": 8, "feedback": "Recovered"}
+    assert second == {"score": 8, "feedback": "Recovered"}
+    assert len(llm.calls) == 2
+    assert scorer.mode_stats["llm"].sources["local_fallback"] == 1
+
+
+def test_fallback_for_questions_without_key_points_is_the_word_count_score():
+    answer = (
+        "A closure is a function bundled with references to its surrounding lexical scope, so an inner "
+        "function keeps access to outer variables even after the outer function has returned."
+    )
+    result = LocalScorer().score(UNREFERENCED, "medium", answer)
+    assert result["score"] == min(len(answer.split()) // 5, 7)
+    assert result["feedback"].startswith("Basic feedback")
+
+
+def test_missing_points_feedback_names_reference_points_only():
+    scorer = LocalScorer()
+    scorer.learn(REFERENCED, "my secret answer about the event loop alice@example.com")
+    result = scorer.score(REFERENCED, "hard", "the event loop")
+    assert "Consider covering" in result["feedback"]
+    assert "alice" not in result["feedback"]
+    assert "secret" not in result["feedback"]
+
+
+def test_learn_raises_relevance_for_similar_answers():
+    scorer = LocalScorer()
+    answer = "libuv thread pool handles fs dns crypto work offloaded from the javascript thread"
+    before = scorer.score(REFERENCED, "hard", answer)["score"]
+    scorer.learn(REFERENCED, answer)
+    after = scorer.score(REFERENCED, "hard", answer)["score"]
+    assert after > before
+
+
+def test_learned_answers_are_bounded():
+    scorer = LocalScorer()
+    for i in range(10):
+        scorer.learn(REFERENCED, f"answer number {i}")
+    assert len(scorer.learned.get(normalize_text(REFERENCED))) == MAX_LEARNED_REFERENCES
+
+
+def test_cache_key_keeps_code_punctuation():
+    assert cache_key("Q", "easy", "x = 1") != cache_key("Q", "easy", "x == 1!")
+    assert cache_key("Q", "easy", "x  =\n1") == cache_key("Q", " Easy ", "x = 1")
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from cache import LRUCache, SingleFlight, SQLiteCache, TieredCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_sqlite_cache_round_trip_and_ttl(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+    cache.set("k", {"name": "Ada"})
+    assert cache.get("k") == {"name": "Ada"}
+    assert SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=-1).get("k") is None
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    calls = []
+
+    async def scenario():
+        flight = SingleFlight()
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+        return results, flight.coalesced
+
+    results, coalesced = asyncio.run(scenario())
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert coalesced == 4
+
+
+def test_single_flight_shares_errors_and_forgets_the_key():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("bad")
+
+        results = await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+        retry = await flight.do("key", lambda: asyncio.sleep(0, result="ok"))
+        return results, retry
+
+    results, retry = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert retry == "ok"
+
+
+def test_single_flight_cancelled_leader_cancels_waiters():
+    async def scenario():
+        flight = SingleFlight()
+        leader = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(1)))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", lambda: asyncio.sleep(1)))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
+
+
+def test_tiered_cache_get_or_set_fills_both_tiers(tmp_path):
+    db_path = str(tmp_path / "tiered.sqlite3")
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"name": "Ada"}
+
+    async def scenario():
+        cache = TieredCache(maxsize=4, db_path=db_path)
+        first = await cache.get_or_set("k", factory)
+        second = await cache.get_or_set("k", factory)
+        # A fresh process only has the disk tier.
+        restarted = await TieredCache(maxsize=4, db_path=db_path).get("k")
+        return first, second, restarted
+
+    assert asyncio.run(scenario()) == ({"name": "Ada"}, {"name": "Ada"}, {"name": "Ada"})
+    assert len(calls) == 1
+
+
+def test_tiered_cache_skips_values_that_are_not_cacheable():
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"complete": len(calls) > 1}
+
+    async def scenario():
+        cache = TieredCache(maxsize=4)
+        cacheable = lambda value: value["complete"]
+        first = await cache.get_or_set("k", factory, cacheable=cacheable)
+        second = await cache.get_or_set("k", factory, cacheable=cacheable)
+        third = await cache.get_or_set("k", factory, cacheable=cacheable)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == ({"complete": False}, {"complete": True}, {"complete": True})
+    assert len(calls) == 2
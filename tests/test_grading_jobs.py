@@ -0,0 +1,146 @@
+import asyncio
+import sqlite3
+
+import grading_jobs
+from grading_jobs import GradingJobManager, JobStore
+
+
+async def wait_for_job(manager, job_id, timeout=2.0):
+    async def poll():
+        while True:
+            job = await manager.get(job_id)
+            if job["status"] == "completed":
+                return job
+            await asyncio.sleep(0.01)
+
+    return await asyncio.wait_for(poll(), timeout)
+
+
+def test_job_grades_every_interview(tmp_path):
+    async def grade(interview):
+        if interview.get("fail"):
+            raise ValueError("bad interview")
+        return {"finalScore": interview["score"]}
+
+    async def scenario():
+        manager = GradingJobManager(grade, db_path=str(tmp_path / "jobs.sqlite3"), workers=2)
+        await manager.start()
+        job_id = await manager.submit([{"score": 70}, {"fail": True}, {"score": 90}])
+        job = await wait_for_job(manager, job_id)
+        await manager.aclose()
+        return job
+
+    job = asyncio.run(scenario())
+    assert (job["total"], job["completed"], job["failed"]) == (3, 3, 1)
+    assert [r.get("finalScore") for r in job["results"]] == [70, None, 90]
+    assert job["results"][1]["error"] == "bad interview"
+
+
+def test_restart_resumes_unfinished_items(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    graded = []
+
+    async def never_finishes(interview):
+        await asyncio.sleep(60)
+
+    async def grade(interview):
+        graded.append(interview["n"])
+        return {"finalScore": interview["n"]}
+
+    async def scenario():
+        first = GradingJobManager(never_finishes, db_path=db_path, workers=1)
+        await first.start()
+        job_id = await first.submit([{"n": 1}, {"n": 2}])
+        await first.aclose()
+
+        second = GradingJobManager(grade, db_path=db_path, workers=1)
+        await second.start()
+        job = await wait_for_job(second, job_id)
+        await second.aclose()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job["completed"] == 2
+    assert sorted(graded) == [1, 2]
+
+
+def test_save_result_counts_each_item_once(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.create_job("job", [{"n": 1}, {"n": 2}])
+    assert store.save_result("job", 0, {"index": 0}, failed=False)
+    assert not store.save_result("job", 0, {"index": 0}, failed=True)
+    job = store.get_job("job")
+    assert (job["completed"], job["failed"], job["status"]) == (1, 0, "running")
+
+
+def test_two_managers_on_one_database_do_not_overcount(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+
+    async def grade(interview):
+        await asyncio.sleep(0.01)
+        return {"finalScore": 1}
+
+    async def scenario():
+        first = GradingJobManager(grade, db_path=db_path, workers=2)
+        await first.start()
+        job_id = await first.submit([{"n": i} for i in range(6)])
+        # A second worker process re-queues the same unfinished items on startup.
+        second = GradingJobManager(grade, db_path=db_path, workers=2)
+        await second.start()
+        job = await wait_for_job(first, job_id)
+        await asyncio.sleep(0.1)
+        job = await first.get(job_id)
+        await first.aclose()
+        await second.aclose()
+        return job
+
+    job = asyncio.run(scenario())
+    assert (job["total"], job["completed"], job["failed"]) == (6, 6, 0)
+    assert len(job["results"]) == 6
+
+
+def test_failed_save_is_retried_without_regrading(tmp_path, monkeypatch):
+    monkeypatch.setattr(grading_jobs, "GRADING_SAVE_RETRY_DELAY", 0.01)
+    graded = []
+
+    async def grade(interview):
+        graded.append(interview)
+        return {"finalScore": 5}
+
+    async def scenario():
+        manager = GradingJobManager(grade, db_path=str(tmp_path / "jobs.sqlite3"), workers=1)
+        save_result = manager.store.save_result
+        failures = [sqlite3.OperationalError("database is locked")] * 2
+
+        def flaky_save(*args):
+            if failures:
+                raise failures.pop()
+            return save_result(*args)
+
+        manager.store.save_result = flaky_save
+        await manager.start()
+        job_id = await manager.submit([{"n": 1}])
+        job = await wait_for_job(manager, job_id)
+        await manager.aclose()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job["completed"] == 1
+    assert len(graded) == 1
+
+
+def test_stream_results_follows_until_completion(tmp_path):
+    async def grade(interview):
+        await asyncio.sleep(0.01 * interview["n"])
+        return {"finalScore": interview["n"]}
+
+    async def scenario():
+        manager = GradingJobManager(grade, db_path=str(tmp_path / "jobs.sqlite3"), workers=3)
+        await manager.start()
+        job_id = await manager.submit([{"n": 3}, {"n": 1}, {"n": 2}])
+        results = [r async for r in manager.stream_results(job_id, follow=True)]
+        await manager.aclose()
+        return results
+
+    results = asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert sorted(r["index"] for r in results) == [0, 1, 2]
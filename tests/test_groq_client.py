@@ -0,0 +1,229 @@
+import asyncio
+
+import httpx
+import pytest
+
+import groq_client
+from groq_client import AsyncGroqClient, CircuitBreaker, CircuitOpenError, GroqError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(groq_client.time, "monotonic", fake)
+    return fake
+
+
+def make_client(handler, breaker=None, max_retries=1):
+    client = AsyncGroqClient(
+        api_key="test-key",
+        url="https://groq.test/v1/completions",
+        max_retries=max_retries,
+        backoff_base=0.001,
+        backoff_max=0.001,
+        breaker=breaker or CircuitBreaker(failure_threshold=2, cooldown=10),
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._semaphore = asyncio.Semaphore(4)
+    return client
+
+
+def raising(make_error):
+    def handler(request):
+        raise make_error(request)
+    return handler
+
+
+# CircuitBreaker
+
+def test_breaker_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_breaker_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    clock.now += 10
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_breaker_probe_failure_reopens_for_a_full_cooldown(clock):
+    breaker = CircuitBreaker(failure_threshold=5, cooldown=10)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 10
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 9
+    assert not breaker.allow()
+
+
+def test_breaker_release_frees_the_probe_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+# AsyncGroqClient
+
+def test_complete_returns_output_text():
+    client = make_client(lambda request: httpx.Response(200, json={"output_text": "hello"}))
+    assert asyncio.run(client.complete("prompt")) == "hello"
+    assert client.breaker.state == "closed"
+
+
+def test_complete_retries_transient_status_then_succeeds():
+    replies = iter([httpx.Response(503), httpx.Response(200, json={"output_text": "ok"})])
+    client = make_client(lambda request: next(replies))
+    assert asyncio.run(client.complete("prompt")) == "ok"
+    assert client.breaker.failures == 0
+
+
+def test_complete_exhausted_retries_count_one_breaker_failure():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429)
+
+    client = make_client(handler, max_retries=2)
+    with pytest.raises(GroqError):
+        asyncio.run(client.complete("prompt"))
+    assert len(calls) == 3
+    assert client.breaker.failures == 1
+
+
+def test_complete_client_error_is_not_retried_or_counted():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400)
+
+    client = make_client(handler)
+    with pytest.raises(GroqError):
+        asyncio.run(client.complete("prompt"))
+    assert len(calls) == 1
+    assert client.breaker.failures == 0
+
+
+@pytest.mark.parametrize("handler", [
+    lambda request: httpx.Response(200, json=["not", "an", "object"]),
+    raising(lambda request: httpx.TooManyRedirects("loop", request=request)),
+    raising(lambda request: RuntimeError("unexpected")),
+])
+def test_complete_wraps_unexpected_failures_and_frees_the_probe(clock, handler):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    clock.now += 10
+    client = make_client(handler, breaker=breaker)
+    with pytest.raises(GroqError):
+        asyncio.run(client.complete("prompt"))
+    assert not breaker._probe_in_flight
+
+
+def test_complete_fails_fast_while_open(clock):
+    calls = []
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    client = make_client(lambda request: calls.append(request), breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(client.complete("prompt"))
+    assert calls == []
+
+
+def deadline_seen(monkeypatch, client, **kwargs):
+    seen = {}
+
+    async def fake_wait_for(coro, timeout):
+        seen["timeout"] = timeout
+        coro.close()
+        return {"output_text": ""}
+
+    monkeypatch.setattr(groq_client.asyncio, "wait_for", fake_wait_for)
+    asyncio.run(client.complete("prompt", **kwargs))
+    return seen["timeout"]
+
+
+def test_deadline_defaults_to_the_configured_call_deadline(monkeypatch):
+    client = AsyncGroqClient(api_key="test-key", timeout=30.0, max_retries=2, deadline=12.5)
+    assert deadline_seen(monkeypatch, client) == 12.5
+    assert deadline_seen(monkeypatch, client, deadline=3.0) == 3.0
+
+
+def test_deadline_stops_retries():
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(503)
+
+    client = make_client(slow, max_retries=10)
+    with pytest.raises(GroqError, match="deadline"):
+        asyncio.run(client.complete("prompt", deadline=0.12))
+
+
+def test_call_admitted_before_the_probe_does_not_release_it(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    release_first = None
+
+    async def handler(request):
+        await release_first.wait()
+        return httpx.Response(400)
+
+    client = make_client(handler, breaker=breaker)
+
+    async def scenario():
+        nonlocal release_first
+        release_first = asyncio.Event()
+        # Admitted while the circuit is closed; ends without a provider verdict.
+        early = asyncio.ensure_future(client.complete("prompt"))
+        # The fake clock also freezes the loop's timers, so only yield to it.
+        for _ in range(20):
+            await asyncio.sleep(0)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow()  # another call takes the half-open probe slot
+        release_first.set()
+        with pytest.raises(GroqError):
+            await early
+
+    asyncio.run(scenario())
+    assert breaker._probe_in_flight
+    assert not breaker.allow()
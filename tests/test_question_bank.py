@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+import pytest
+
+from question_bank import SEED_POOLS, QuestionBank, _time_limit
+
+COUNTS = {"easy": 2, "medium": 2, "hard": 2}
+
+
+class RecordingRefill:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, role, difficulty, n):
+        self.calls.append((role, difficulty))
+        return [{"question": f"{role} {difficulty} question {i}", "timeLimit": "45s"} for i in range(n)]
+
+
+def make_bank(tmp_path, refill_fn=None, **kwargs):
+    return QuestionBank(refill_fn=refill_fn, path=str(tmp_path / "bank.json"), roles=[], **kwargs)
+
+
+def test_same_seed_gives_the_same_set(tmp_path):
+    first = make_bank(tmp_path).assemble("fullstack", COUNTS, seed=7)
+    second = make_bank(tmp_path).assemble("fullstack", COUNTS, seed=7)
+    assert first == second
+    assert [q["difficulty"] for q in first] == ["easy", "easy", "medium", "medium", "hard", "hard"]
+    assert [q["id"] for q in first] == [1, 2, 3, 4, 5, 6]
+
+
+def test_different_seeds_give_different_sets(tmp_path):
+    bank = make_bank(tmp_path)
+    sets = {tuple(q["question"] for q in bank.assemble("fullstack", COUNTS, seed)) for seed in range(5)}
+    assert len(sets) > 1
+
+
+def test_too_small_pool_is_a_miss(tmp_path):
+    bank = make_bank(tmp_path)
+    assert bank.assemble("fullstack", {"easy": len(SEED_POOLS["fullstack"]["easy"]) + 1}, seed=1) is None
+    assert bank.assemble("data-science", {"easy": 1}, seed=1) is None
+
+
+def test_refill_is_limited_to_known_roles_and_difficulties(tmp_path):
+    refill = RecordingRefill()
+
+    async def scenario():
+        bank = make_bank(tmp_path, refill_fn=refill, min_pool_size=100, target_pool_size=10)
+        bank.schedule_refill("made-up-role", "easy")
+        bank.schedule_refill("fullstack", "impossible")
+        bank.schedule_refill("fullstack", "easy")
+        await asyncio.gather(*bank._refill_tasks.values())
+        return bank
+
+    bank = asyncio.run(scenario())
+    assert refill.calls == [("fullstack", "easy")]
+    assert len(bank.pool("fullstack", "easy")) == 10
+    assert "made-up-role" not in bank.pools
+
+
+def test_save_load_round_trip(tmp_path):
+    refill = RecordingRefill()
+
+    async def scenario():
+        bank = make_bank(tmp_path, refill_fn=refill, target_pool_size=10)
+        bank.schedule_refill("fullstack", "hard")
+        await asyncio.gather(*bank._refill_tasks.values())
+        return bank
+
+    bank = asyncio.run(scenario())
+    reloaded = make_bank(tmp_path)
+    assert reloaded.pools == bank.pools
+    assert reloaded.pool("fullstack", "hard")[-1]["timeLimit"] == 45
+
+
+@pytest.mark.parametrize("content", [
+    "[]",
+    '"bank"',
+    "{not json",
+    '{"fullstack": ["What is React?"]}',
+    '{"fullstack": {"easy": "What is React?"}}',
+])
+def test_malformed_bank_files_fall_back_to_the_seed_pools(tmp_path, content):
+    (tmp_path / "bank.json").write_text(content)
+    bank = make_bank(tmp_path)
+    assert {d: len(p) for d, p in bank.pools["fullstack"].items()} == {
+        d: len(q) for d, q in SEED_POOLS["fullstack"].items()
+    }
+
+
+def test_bad_entries_are_dropped_and_good_ones_kept(tmp_path):
+    (tmp_path / "bank.json").write_text(json.dumps({
+        "backend": {"easy": [
+            {"question": "What is an index?", "timeLimit": 30},
+            {"timeLimit": 30},
+            "What is a join?",
+            {"question": 42},
+            {"question": "what is an  INDEX?"},
+        ]},
+    }))
+    assert make_bank(tmp_path).pool("backend", "easy") == [{"question": "What is an index?", "timeLimit": 30}]
+
+
+@pytest.mark.parametrize("value, expected", [(90, 90), ("60", 60), ("60 seconds", 60), ("soon", 20), (None, 20), (0, 20)])
+def test_time_limit_parsing(value, expected):
+    assert _time_limit(value, 20) == expected
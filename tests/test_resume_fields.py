@@ -0,0 +1,72 @@
+import pytest
+
+from resume_fields import extract_fields_local
+
+THRESHOLD = 0.8  # RESUME_FIELD_CONFIDENCE default: at or above it the LLM is skipped
+
+
+@pytest.mark.parametrize("text", [
+    "San Francisco, CA\nsoftware engineer\nExperience at three startups",
+    "Technical Skills\nPython, Go, Kubernetes",
+    "Google Cloud Platform\nCertified architect since 2020",
+])
+def test_name_from_position_alone_is_not_trusted(text):
+    name = extract_fields_local(text)["name"]
+    assert name.value is None or name.confidence < THRESHOLD
+
+
+def test_name_contradicted_by_email_is_not_trusted():
+    fields = extract_fields_local("Google Cloud Platform\njohn.smith@example.com\nJohn Smith, Berlin")
+    assert fields["name"].confidence < THRESHOLD
+
+
+def test_name_corroborated_by_email_is_trusted():
+    fields = extract_fields_local("Jane Doe\njane.doe@example.com\nBackend developer")
+    assert fields["name"] == ("Jane Doe", fields["name"].confidence)
+    assert fields["name"].confidence >= THRESHOLD
+
+
+@pytest.mark.parametrize("text", [
+    "Jane Doe\njane.doe@example.com\nAccount No 1234 5678 9012",
+    "Jane Doe\njane.doe@example.com\nID 1234567890",
+])
+def test_unlabelled_unformatted_digit_runs_are_not_trusted_as_phones(text):
+    phone = extract_fields_local(text)["phone"]
+    assert phone.value is None or phone.confidence < THRESHOLD
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("+1 555-123-4567", "+1 555-123-4567"),
+    ("Phone: 555-123-4567", "555-123-4567"),
+    ("(415) 555-0199", "(415) 555-0199"),
+])
+def test_labelled_or_formatted_phones_are_trusted(line, expected):
+    phone = extract_fields_local(f"Jane Doe\njane.doe@example.com\n{line}")["phone"]
+    assert phone.value == expected
+    assert phone.confidence >= THRESHOLD
+
+
+def test_two_phone_numbers_go_to_the_llm():
+    phone = extract_fields_local("Jane Doe\nHome: (312) 555-0175 | Mobile: (312) 555-0199")["phone"]
+    assert phone.confidence < THRESHOLD
+
+
+@pytest.mark.parametrize("line", [
+    "BSc 2014 - 2018 2018 - 2020",
+    "2012-2016 | 2016-2019 | 2019-2023",
+])
+def test_year_ranges_are_not_phone_numbers(line):
+    assert extract_fields_local(f"Jane Doe\n{line}")["phone"].value is None
+
+
+def test_year_ranges_do_not_hide_a_labelled_phone():
+    fields = extract_fields_local("Jane Doe\n2012-2016 | 2016-2019\nPhone: +48 601 234 567")
+    assert fields["phone"].value == "+48 601 234 567"
+
+
+def test_email_in_header_is_trusted_and_several_emails_lower_confidence():
+    single = extract_fields_local("Jane Doe\njane.doe@example.com")["email"]
+    several = extract_fields_local("Jane Doe\njane.doe@example.com\njdoe@work.example.com")["email"]
+    assert single == ("jane.doe@example.com", single.confidence)
+    assert single.confidence >= THRESHOLD
+    assert several.confidence < single.confidence
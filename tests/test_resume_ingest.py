@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+import pytest
+from docx import Document
+from fastapi import HTTPException
+
+import resume_ingest
+from resume_ingest import ResumeIngestor, read_upload
+
+
+class FakeUpload:
+    """Minimal UploadFile: `size` as reported by the client, data served in reads"""
+
+    def __init__(self, data, size=None):
+        self.data = BytesIO(data)
+        self.size = size
+        self.reads = 0
+
+    async def read(self, n):
+        self.reads += 1
+        return self.data.read(n)
+
+
+def test_read_upload_returns_data_and_feeds_the_hasher_every_chunk(monkeypatch):
+    monkeypatch.setattr(resume_ingest, "UPLOAD_CHUNK_SIZE", 10)
+    data = bytes(range(256)) * 3
+    hasher = hashlib.sha256()
+    assert asyncio.run(read_upload(FakeUpload(data), max_bytes=len(data), hasher=hasher)) == data
+    assert hasher.hexdigest() == hashlib.sha256(data).hexdigest()
+
+
+def test_read_upload_rejects_as_soon_as_the_limit_is_passed(monkeypatch):
+    monkeypatch.setattr(resume_ingest, "UPLOAD_CHUNK_SIZE", 10)
+    upload = FakeUpload(b"x" * 1000)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(read_upload(upload, max_bytes=25))
+    assert exc.value.status_code == 413
+    assert upload.reads == 3
+
+
+def test_read_upload_rejects_declared_size_without_reading():
+    upload = FakeUpload(b"x", size=100)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(read_upload(upload, max_bytes=50))
+    assert exc.value.status_code == 413
+    assert upload.reads == 0
+
+
+def in_process(ingestor, calls=None):
+    """Run extraction functions inline instead of in the process pool"""
+
+    async def run(fn, *args):
+        if calls is not None:
+            calls.append(args[1:3])
+        return fn(*args)
+
+    ingestor._run = run
+    return ingestor
+
+
+def test_pdf_extraction_stops_once_max_chars_is_collected(monkeypatch):
+    def fake_pages(data, start, stop, max_chars):
+        return "".join("p" * 1000 for _ in range(start, min(stop, 20))), 20
+
+    monkeypatch.setattr(resume_ingest, "extract_pdf_pages", fake_pages)
+    calls = []
+    ingestor = in_process(ResumeIngestor(workers=2, pages_per_task=1, max_chars=2500), calls)
+    text = asyncio.run(ingestor.extract_text(b"%PDF", "pdf"))
+    assert len(text) == 2500
+    assert calls == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_docx_extraction_stops_at_max_chars():
+    doc = Document()
+    for i in range(200):
+        doc.add_paragraph(f"Paragraph {i} " + "word " * 20)
+    buffer = BytesIO()
+    doc.save(buffer)
+    ingestor = in_process(ResumeIngestor(max_chars=500))
+    text = asyncio.run(ingestor.extract_text(buffer.getvalue(), "docx"))
+    assert len(text) == 500
+    assert text.startswith("Paragraph 0 ")
+
+
+def test_broken_pool_is_replaced_and_the_extraction_retried():
+    ingestor = ResumeIngestor(workers=1, max_chars=100)
+    first_pool = ingestor._get_executor()
+    attempts = []
+
+    async def run(fn, *args):
+        attempts.append(ingestor._get_executor())
+        if len(attempts) == 1:
+            raise BrokenProcessPool("worker died")
+        return "text", 1
+
+    ingestor._run = run
+    assert asyncio.run(ingestor.extract_text(b"%PDF", "pdf")) == "text"
+    assert attempts[0] is first_pool
+    assert attempts[1] is not first_pool
+    ingestor.shutdown()
+
+
+def test_pool_broken_twice_is_a_503():
+    ingestor = ResumeIngestor(workers=1)
+
+    async def run(fn, *args):
+        raise BrokenProcessPool("worker died")
+
+    ingestor._run = run
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(ingestor.extract_text(b"%PDF", "pdf"))
+    assert exc.value.status_code == 503
+    assert ingestor._executor is None
+
+
+def test_reset_only_replaces_the_pool_that_broke():
+    ingestor = ResumeIngestor(workers=1)
+    old = ingestor._get_executor()
+    ingestor._reset_executor(old)
+    new = ingestor._get_executor()
+    # A second failure reported against the old pool must not discard the new one.
+    ingestor._reset_executor(old)
+    assert ingestor._get_executor() is new
+    ingestor.shutdown()
+
+
+def die(*args):
+    import os
+
+    os._exit(1)
+
+
+def test_real_worker_crash_is_recovered(monkeypatch):
+    ingestor = ResumeIngestor(workers=1, max_chars=100)
+    pool_run = ResumeIngestor._run
+    crashed = []
+
+    async def run(self, fn, *args):
+        # The first task kills its worker process; the retry runs on the new pool.
+        if not crashed:
+            crashed.append(self._get_executor())
+            return await pool_run(self, die, *args)
+        return "recovered", 1
+
+    monkeypatch.setattr(ResumeIngestor, "_run", run)
+    assert asyncio.run(ingestor.extract_text(b"%PDF", "pdf")) == "recovered"
+    assert ingestor._get_executor() is not crashed[0]
+    ingestor.shutdown()
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from score_batcher import MicroBatcher
+
+
+class Recorder:
+    """Batch/single functions that echo items and record how they were called."""
+
+    def __init__(self, batch_reply=None, fail=False):
+        self.batches = []
+        self.singles = []
+        self.batch_reply = batch_reply
+        self.fail = fail
+
+    async def batch_fn(self, items):
+        self.batches.append(list(items))
+        if self.fail:
+            raise RuntimeError("provider down")
+        if self.batch_reply is not None:
+            return self.batch_reply(items)
+        return [f"batch:{item}" for item in items]
+
+    async def single_fn(self, item):
+        self.singles.append(item)
+        return f"single:{item}"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_items_share_one_batch_in_order():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=5)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert run(scenario()) == [f"batch:{i}" for i in range(5)]
+    assert recorder.batches == [[0, 1, 2, 3, 4]]
+    assert recorder.singles == []
+
+
+def test_full_batch_flushes_without_waiting():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=3, max_wait_ms=60_000)
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(6))), timeout=1)
+
+    assert run(scenario()) == [f"batch:{i}" for i in range(6)]
+    assert recorder.batches == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_lone_item_goes_to_single_fn():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=1)
+        return await batcher.submit("a")
+
+    assert run(scenario()) == "single:a"
+    assert recorder.batches == []
+
+
+@pytest.mark.parametrize("reply", [
+    lambda items: None,
+    lambda items: ["only one"],
+])
+def test_malformed_batch_reply_falls_back_to_single_calls(reply):
+    recorder = Recorder(batch_reply=reply)
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=1)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+        return results, batcher.stats()
+
+    results, stats = run(scenario())
+    assert results == ["single:0", "single:1", "single:2"]
+    assert sorted(recorder.singles) == [0, 1, 2]
+    assert stats["malformed_batches"] == 1
+    assert stats["llm_calls"] == 4
+
+
+def test_batch_exception_reaches_every_caller():
+    recorder = Recorder(fail=True)
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=1)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    results = run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_items_are_only_batched_within_their_group():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=5)
+        return await asyncio.gather(
+            batcher.submit("a1", group="a"),
+            batcher.submit("b1", group="b"),
+            batcher.submit("a2", group="a"),
+            batcher.submit("b2", group="b"),
+        )
+
+    assert run(scenario()) == ["batch:a1", "batch:b1", "batch:a2", "batch:b2"]
+    assert sorted(recorder.batches) == [["a1", "a2"], ["b1", "b2"]]
+
+
+def test_aclose_flushes_pending_items():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=60_000)
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(0)
+        await batcher.aclose()
+        return await asyncio.gather(*pending)
+
+    assert run(scenario()) == ["batch:0", "batch:1"]
+
+
+def test_direct_calls_are_counted_in_stats():
+    recorder = Recorder()
+
+    async def scenario():
+        batcher = MicroBatcher(recorder.batch_fn, recorder.single_fn, max_batch_size=8, max_wait_ms=1)
+        direct = await batcher.call("a")
+        batched = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+        return direct, batched, batcher.stats()
+
+    direct, batched, stats = run(scenario())
+    assert direct == "single:a"
+    assert batched == ["batch:0", "batch:1", "batch:2"]
+    assert (stats["items"], stats["batches"], stats["llm_calls"]) == (4, 2, 2)
+    assert stats["calls_per_item"] == 0.5
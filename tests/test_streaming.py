@@ -0,0 +1,69 @@
+import json
+import random
+
+import pytest
+
+from streaming import JsonArrayItemParser, format_event, media_type
+
+ITEMS = [
+    {"id": 1, "difficulty": "easy", "question": "What is a closure?", "timeLimit": 20},
+    {"id": 2, "difficulty": "medium", "question": 'Explain "this" binding, {braces} and [brackets].', "timeLimit": 60},
+    {"id": 3, "difficulty": "hard", "question": "Escapes: \\ \" \n and unicode é", "tags": ["a", {"b": [1, 2]}]},
+]
+
+
+def feed_chunks(text, sizes):
+    parser = JsonArrayItemParser()
+    items = []
+    pos = 0
+    for size in sizes:
+        items.extend(parser.feed(text[pos:pos + size]))
+        pos += size
+    items.extend(parser.feed(text[pos:]))
+    return items
+
+
+def test_whole_array_in_one_chunk():
+    assert JsonArrayItemParser().feed(json.dumps(ITEMS)) == ITEMS
+
+
+def test_one_character_at_a_time():
+    text = json.dumps(ITEMS, indent=2)
+    assert feed_chunks(text, [1] * len(text)) == ITEMS
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_chunk_splits(seed):
+    rng = random.Random(seed)
+    text = "Here are the questions:\n" + json.dumps(ITEMS, indent=rng.choice([None, 2])) + "\nDone."
+    sizes = [rng.randint(1, 12) for _ in range(len(text))]
+    assert feed_chunks(text, sizes) == ITEMS
+
+
+def test_items_are_emitted_as_soon_as_they_complete():
+    parser = JsonArrayItemParser()
+    text = json.dumps(ITEMS)
+    first_end = text.index("}") + 1
+    assert parser.feed(text[:first_end - 1]) == []
+    assert parser.feed(text[first_end - 1:first_end]) == [ITEMS[0]]
+
+
+def test_brackets_inside_strings_do_not_end_items():
+    text = '[{"q": "a ] b } c [ d {"}, {"q": "\\"}]\\""}]'
+    assert JsonArrayItemParser().feed(text) == [{"q": "a ] b } c [ d {"}, {"q": '"}]"'}]
+
+
+def test_non_object_elements_and_invalid_items_are_skipped():
+    text = '[1, "two", {"ok": 1}, {"bad": tru}, [3], {"ok": 2}]'
+    assert JsonArrayItemParser().feed(text) == [{"ok": 1}, {"ok": 2}]
+
+
+def test_text_without_array_yields_nothing():
+    assert JsonArrayItemParser().feed("Sorry, I cannot help with that.") == []
+
+
+def test_format_event_sse_and_ndjson():
+    assert format_event("question", {"id": 1}) == 'event: question\ndata: {"id": 1}\n\n'
+    assert json.loads(format_event("done", {"n": 2}, "ndjson")) == {"type": "done", "data": {"n": 2}}
+    assert media_type("sse") == "text/event-stream"
+    assert media_type("ndjson") == "application/x-ndjson"